@@ -21,7 +21,9 @@ from .data_loader import DataLoader, DataTransformer
 from .data_profiler import (
     IntelligentDataProfiler,
     DatasetProfile,
-    ColumnProfile
+    ColumnProfile,
+    IssueFlag,
+    df_fingerprint
 )
 from .reconcile_engine import (
     ReconciliationEngine,
@@ -46,6 +48,8 @@ __all__ = [
     "IntelligentDataProfiler",
     "DatasetProfile",
     "ColumnProfile",
+    "IssueFlag",
+    "df_fingerprint",
 
     # Reconciliation
     "ReconciliationEngine",
@@ -84,9 +88,9 @@ def quick_reconcile(source_file: str, target_file: str, output_dir: str = "outpu
         >>> result = quick_reconcile('source.csv', 'target.csv')
         >>> print(f"Match rate: {result.summary['match_rate']:.2f}%")
     """
-    # Load data
-    source = DataLoader.auto_detect_and_load(source_file)
-    target = DataLoader.auto_detect_and_load(target_file)
+    # Load data (repeat runs read the cached Feather copy)
+    source = DataLoader.load_with_cache(source_file)
+    target = DataLoader.load_with_cache(target_file)
 
     # Profile and get strategy
     profiler = IntelligentDataProfiler()
@@ -6,15 +6,140 @@ Analyzes datasets to understand structure, types, and recommend optimal matching
 
 import pandas as pd
 import numpy as np
+import re
+import sys
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
+from enum import IntFlag
+import copy
+import hashlib
 import logging
-from collections import Counter
+import os
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    import narwhals as nw
+    NARWHALS_AVAILABLE = True
+except ImportError:
+    NARWHALS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Column-name fragments used by _infer_column_type
+_ID_PATTERNS = ('id', '_id', 'key', 'code', 'number', 'ref', 'transaction')
+_DATE_PATTERNS = ('date', 'time', 'datetime', 'created', 'updated', 'timestamp')
+_AMOUNT_PATTERNS = ('amount', 'price', 'cost', 'value', 'total', 'balance')
 
-@dataclass
+# Anything other than word characters, whitespace and hyphens
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s-]')
+
+# Leading year-first (2024-01-31, 2024/01/31, 2024.01.31), day/month-first
+# (01/31/2024, 31.01.2024) or month-name (Jan 31, 2024 / 31 Jan 2024) date,
+# used to sniff date strings without calling pd.to_datetime
+_DATE_RE = re.compile(
+    r'^\s*(\d{4}[-/.]\d{1,2}[-/.]\d{1,2}'
+    r'|\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4}'
+    r'|[A-Za-z]{3,9}\.? \d{1,2},? \d{4}'
+    r'|\d{1,2} [A-Za-z]{3,9}\.?,? \d{4})'
+)
+
+
+def _is_text_dtype(dtype) -> bool:
+    """True for object columns and string columns, including Arrow-backed strings."""
+    return pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+
+
+def _as_pandas(df: Any) -> pd.DataFrame:
+    """
+    Return `df` as a pandas DataFrame.
+
+    Polars frames (eager or lazy) and PyArrow tables are converted to
+    Arrow-backed pandas columns, which reuses their buffers instead of
+    building object columns. Any other frame Narwhals supports goes through
+    its Arrow export.
+    """
+    if isinstance(df, pd.DataFrame):
+        return df
+    if POLARS_AVAILABLE and isinstance(df, pl.LazyFrame):
+        df = df.collect()
+    if POLARS_AVAILABLE and isinstance(df, pl.DataFrame):
+        return df.to_pandas(use_pyarrow_extension_array=True)
+    if PYARROW_AVAILABLE and isinstance(df, pa.Table):
+        return df.to_pandas(types_mapper=pd.ArrowDtype)
+    if NARWHALS_AVAILABLE and PYARROW_AVAILABLE:
+        frame = nw.from_native(df)
+        if isinstance(frame, nw.LazyFrame):
+            frame = frame.collect()
+        return frame.to_arrow().to_pandas(types_mapper=pd.ArrowDtype)
+    raise TypeError(f"Unsupported frame type: {type(df).__name__}")
+
+
+def _non_null(col: pd.Series, null_count: int) -> pd.Series:
+    """`col` without its nulls; the column itself (no copy) when it has none."""
+    return col.dropna() if null_count else col
+
+
+def _head_non_null(col: pd.Series, n: int, null_count: int) -> List[Any]:
+    """First `n` non-null values of `col`, scanning only as far as needed."""
+    if null_count == 0:
+        return col.head(n).tolist()
+
+    values: List[Any] = []
+    start, window = 0, max(n, 1)
+    while len(values) < n and start < len(col):
+        values.extend(col.iloc[start:start + window].dropna().head(n - len(values)).tolist())
+        start += window
+        window *= 2
+    return values
+
+
+def df_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Content hash of a DataFrame: column names, dtypes and every value.
+    
+    Frames with equal content get the same fingerprint however they were
+    loaded, so it can key caches of results derived from the data. Row
+    hashes come from pd.util.hash_pandas_object (vectorized, index ignored).
+    Raises TypeError for columns holding unhashable values such as lists.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(name), str(dtype)) for name, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class IssueFlag(IntFlag):
+    """Bit flags mirroring the messages in ColumnProfile.issues."""
+    WHITESPACE = 1
+    CASE = 2
+    DUPLICATE = 4
+    HIGH_NULL = 8
+    OUTLIERS = 16
+    NEGATIVE = 32
+    SPECIAL = 64
+    MODERATE_NULL = 128
+    ALL_NULL = 256
+
+
+# __slots__ for the profile dataclasses where supported (Python 3.10+): no
+# per-instance __dict__ on the thousands of ColumnProfiles of a wide frame
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ColumnProfile:
     """Profile of a single column."""
     name: str
@@ -24,14 +149,15 @@ class ColumnProfile:
     unique_count: int
     unique_percentage: float
     is_unique: bool
-    sample_values: List[Any]
+    sample_values: Tuple[Any, ...]
     inferred_type: str  # 'id', 'numeric', 'date', 'category', 'text', 'boolean'
     recommended_for_key: bool
     data_quality_score: float  # 0-100
-    issues: List[str]
+    issues: Tuple[str, ...]
+    issue_flags: int = 0  # IssueFlag bits for the entries in `issues`
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DatasetProfile:
     """Comprehensive dataset profile."""
     row_count: int
@@ -52,27 +178,52 @@ class IntelligentDataProfiler:
     def __init__(self):
         self.min_uniqueness_for_key = 0.95  # 95% unique to be considered a key
         self.sample_size = 100
+        # suggest_reconciliation_strategy results, keyed by profile identity
+        self._strategy_cache: OrderedDict = OrderedDict()
+        self.strategy_cache_size = 32
+
+    def profile_column(self, df: Any, col_name: str,
+                       precomputed: Optional[Dict[str, Any]] = None) -> ColumnProfile:
+        """
+        Profile a single column comprehensively.
 
-    def profile_column(self, df: pd.DataFrame, col_name: str) -> ColumnProfile:
-        """Profile a single column comprehensively."""
+        `df` may be a pandas, Polars or PyArrow frame (see profile_dataset).
+
+        `precomputed` holds statistics already gathered for this column by
+        profile_dataset (see _batch_column_stats); anything missing from it
+        is computed here with pandas.
+        """
+        df = _as_pandas(df)
         col = df[col_name]
         total_rows = len(df)
-
-        # Basic statistics
-        null_count = col.isna().sum()
+        stats = precomputed or {}
+
+        # Basic statistics; without precomputed counts one factorize (a single
+        # hash table) yields the null, unique and duplicate counts together
+        if not all(k in stats for k in ('null_count', 'unique_count', 'dup_count')):
+            codes, uniques = pd.factorize(col, use_na_sentinel=True)
+            n_null = int(np.count_nonzero(codes == -1))
+            # duplicated() counts every repeat, including nulls after the first
+            stats = {
+                'null_count': n_null,
+                'unique_count': len(uniques),
+                'dup_count': len(codes) - len(uniques) - (1 if n_null else 0),
+                **stats,
+            }
+        null_count = stats['null_count']
         null_percentage = (null_count / total_rows) * 100
-        unique_count = col.nunique()
+        unique_count = stats['unique_count']
         unique_percentage = (unique_count / total_rows) * 100
         is_unique = unique_percentage >= self.min_uniqueness_for_key
 
         # Sample values (non-null)
-        sample_values = col.dropna().head(self.sample_size).tolist()
+        sample_values = _head_non_null(col, self.sample_size, null_count)
 
         # Infer semantic type
-        inferred_type = self._infer_column_type(col, col_name)
+        inferred_type = self._infer_column_type(col, col_name, stats)
 
         # Data quality issues
-        issues = self._detect_column_issues(col, col_name, inferred_type)
+        issues, issue_flags = self._detect_column_issues(col, col_name, inferred_type, stats)
 
         # Calculate quality score
         quality_score = self._calculate_quality_score(
@@ -81,7 +232,7 @@ class IntelligentDataProfiler:
 
         # Recommend for key?
         recommended_for_key = self._recommend_for_key(
-            is_unique, inferred_type, null_percentage, unique_percentage, issues
+            is_unique, inferred_type, null_percentage, unique_percentage, issues, issue_flags
         )
 
         return ColumnProfile(
@@ -92,66 +243,71 @@ class IntelligentDataProfiler:
             unique_count=int(unique_count),
             unique_percentage=float(unique_percentage),
             is_unique=bool(is_unique),
-            sample_values=sample_values,
+            sample_values=tuple(sample_values),
             inferred_type=inferred_type,
             recommended_for_key=recommended_for_key,
             data_quality_score=float(quality_score),
-            issues=issues
+            issues=tuple(issues),
+            issue_flags=int(issue_flags)
         )
 
-    def _infer_column_type(self, col: pd.Series, col_name: str) -> str:
+    def _infer_column_type(self, col: pd.Series, col_name: str,
+                           stats: Optional[Dict[str, Any]] = None) -> str:
         """Infer semantic type of column."""
+        stats = stats or {}
+
         # Check column name patterns
         name_lower = col_name.lower()
-        id_patterns = ['id', '_id', 'key', 'code', 'number', 'ref', 'transaction']
-        date_patterns = ['date', 'time', 'datetime', 'created', 'updated', 'timestamp']
-        amount_patterns = ['amount', 'price', 'cost', 'value', 'total', 'balance']
 
         # Check if it's an ID column by name
-        if any(pattern in name_lower for pattern in id_patterns):
+        if any(pattern in name_lower for pattern in _ID_PATTERNS):
             return 'id'
 
         # Check data type
         if pd.api.types.is_numeric_dtype(col):
             # Check if it looks like an ID (integers, sequential, or unique)
             if pd.api.types.is_integer_dtype(col):
-                uniqueness = col.nunique() / len(col)
+                unique_count = stats['unique_count'] if 'unique_count' in stats else col.nunique()
+                uniqueness = unique_count / len(col)
                 if uniqueness > 0.9:
                     return 'id'
 
             # Check if it's an amount
-            if any(pattern in name_lower for pattern in amount_patterns):
+            if any(pattern in name_lower for pattern in _AMOUNT_PATTERNS):
                 return 'numeric_amount'
 
             return 'numeric'
 
-        elif pd.api.types.is_datetime64_any_dtype(col):
+        elif pd.api.types.is_datetime64_any_dtype(col) or col.dtype.kind == 'M':
+            # kind 'M' also covers Arrow date32/date64 columns
             return 'date'
 
         elif pd.api.types.is_bool_dtype(col):
             return 'boolean'
 
-        elif pd.api.types.is_object_dtype(col):
+        elif _is_text_dtype(col.dtype):
             # String column - try to infer further
-            non_null = col.dropna()
-            if len(non_null) == 0:
+            non_null_count = len(col) - stats['null_count'] if 'null_count' in stats else col.count()
+            if non_null_count == 0:
                 return 'text'
 
-            # Try to parse as date
-            if any(pattern in name_lower for pattern in date_patterns):
-                try:
-                    pd.to_datetime(non_null.head(100), errors='coerce')
+            # Date-like name: check that the values look like dates too
+            if any(pattern in name_lower for pattern in _DATE_PATTERNS):
+                sample = pd.Series(_head_non_null(col, 100, len(col) - non_null_count), dtype=object).astype(str)
+                if sample.str.match(_DATE_RE).mean() > 0.8:
                     return 'date_string'
-                except:
-                    pass
 
             # Check uniqueness for category vs text
-            uniqueness = non_null.nunique() / len(non_null)
+            unique_count = stats['unique_count'] if 'unique_count' in stats else col.nunique()
+            uniqueness = unique_count / non_null_count
             if uniqueness < 0.1:  # Less than 10% unique = category
                 return 'category'
             elif uniqueness > 0.9:  # More than 90% unique = id or text
                 # Check average length
-                avg_len = non_null.astype(str).str.len().mean()
+                if 'avg_len' in stats:
+                    avg_len = stats['avg_len']
+                else:
+                    avg_len = _non_null(col, len(col) - non_null_count).astype(str).str.len().mean()
                 if avg_len < 20:
                     return 'id'
                 else:
@@ -161,62 +317,103 @@ class IntelligentDataProfiler:
 
         return 'unknown'
 
-    def _detect_column_issues(self, col: pd.Series, col_name: str, inferred_type: str) -> List[str]:
-        """Detect data quality issues in a column."""
+    def _detect_column_issues(self, col: pd.Series, col_name: str, inferred_type: str,
+                              stats: Optional[Dict[str, Any]] = None) -> Tuple[List[str], IssueFlag]:
+        """Detect data quality issues in a column; returns the messages and their IssueFlag bits."""
+        stats = stats or {}
         issues = []
+        flags = IssueFlag(0)
 
         # High null percentage
-        null_pct = (col.isna().sum() / len(col)) * 100
+        null_count = stats['null_count'] if 'null_count' in stats else col.isna().sum()
+        null_pct = (null_count / len(col)) * 100
         if null_pct > 50:
             issues.append(f"High null percentage: {null_pct:.1f}%")
+            flags |= IssueFlag.HIGH_NULL
         elif null_pct > 10:
             issues.append(f"Moderate null percentage: {null_pct:.1f}%")
+            flags |= IssueFlag.MODERATE_NULL
 
-        non_null = col.dropna()
+        non_null = _non_null(col, null_count)
         if len(non_null) == 0:
             issues.append("Column is entirely null")
-            return issues
+            return issues, flags | IssueFlag.ALL_NULL
 
         # String-specific issues
-        if pd.api.types.is_object_dtype(col):
+        if _is_text_dtype(col.dtype):
+            if not all(k in stats for k in ('whitespace_count', 'lower_unique_count', 'special_count')):
+                # Convert once; strip/lower run on Arrow buffers when available.
+                # The regex check stays on Python str, since Arrow's RE2 treats
+                # \w as ASCII-only and would flag accented letters.
+                text = non_null.astype(str)
+                fast_text = text.astype('string[pyarrow]') if PYARROW_AVAILABLE else text
+
             # Leading/trailing whitespace
-            has_whitespace = non_null.astype(str).str.strip() != non_null.astype(str)
-            if has_whitespace.any():
-                issues.append(f"Whitespace issues in {has_whitespace.sum()} values")
+            if 'whitespace_count' in stats:
+                whitespace_count = stats['whitespace_count']
+            else:
+                # Stripping only ever shortens a value, so compare lengths, not strings
+                whitespace_count = (fast_text.str.strip().str.len() != fast_text.str.len()).sum()
+            if whitespace_count > 0:
+                issues.append(f"Whitespace issues in {whitespace_count} values")
+                flags |= IssueFlag.WHITESPACE
 
             # Case inconsistency (same value in different cases)
-            lower_values = non_null.astype(str).str.lower()
-            if lower_values.nunique() < non_null.nunique():
+            if 'lower_unique_count' in stats:
+                lower_unique, unique_count = stats['lower_unique_count'], stats['unique_count']
+            else:
+                lower_unique = fast_text.str.lower().nunique()
+                unique_count = non_null.nunique()
+            if lower_unique < unique_count:
                 issues.append("Case inconsistency detected")
+                flags |= IssueFlag.CASE
 
             # Special characters
-            has_special = non_null.astype(str).str.contains(r'[^\w\s-]', regex=True, na=False)
-            if has_special.any():
-                issues.append(f"Special characters in {has_special.sum()} values")
+            if 'special_count' in stats:
+                special_count = stats['special_count']
+            else:
+                special_count = text.str.contains(_SPECIAL_CHAR_RE, na=False).sum()
+            if special_count > 0:
+                issues.append(f"Special characters in {special_count} values")
+                flags |= IssueFlag.SPECIAL
 
         # Numeric-specific issues
         if pd.api.types.is_numeric_dtype(col):
             # Outliers (simple IQR method)
-            Q1 = non_null.quantile(0.25)
-            Q3 = non_null.quantile(0.75)
+            Q1 = stats['q1'] if 'q1' in stats else non_null.quantile(0.25)
+            Q3 = stats['q3'] if 'q3' in stats else non_null.quantile(0.75)
             IQR = Q3 - Q1
-            outliers = ((non_null < (Q1 - 3 * IQR)) | (non_null > (Q3 + 3 * IQR))).sum()
+            lower, upper = Q1 - 3 * IQR, Q3 + 3 * IQR
+            col_min = stats['min'] if 'min' in stats else non_null.min()
+            col_max = stats['max'] if 'max' in stats else non_null.max()
+            # Only build the comparison masks when some value lies outside the fences
+            if col_min < lower or col_max > upper:
+                values = non_null.to_numpy(dtype=np.float64)
+                outliers = int(np.count_nonzero((values < lower) | (values > upper)))
+            else:
+                outliers = 0
             if outliers > 0:
                 issues.append(f"Potential outliers: {outliers} values")
+                flags |= IssueFlag.OUTLIERS
 
             # Negative values where unexpected
             if 'amount' in col_name.lower() or 'price' in col_name.lower():
-                negatives = (non_null < 0).sum()
+                if 'negative_count' in stats:
+                    negatives = stats['negative_count']
+                else:
+                    negatives = (non_null < 0).sum() if col_min < 0 else 0
                 if negatives > 0:
                     issues.append(f"Negative values: {negatives}")
+                    flags |= IssueFlag.NEGATIVE
 
         # Duplicate values (for ID columns)
         if inferred_type == 'id':
-            dup_count = col.duplicated().sum()
+            dup_count = stats['dup_count'] if 'dup_count' in stats else col.duplicated().sum()
             if dup_count > 0:
                 issues.append(f"Duplicate values: {dup_count} (expected unique)")
+                flags |= IssueFlag.DUPLICATE
 
-        return issues
+        return issues, flags
 
     def _calculate_quality_score(self, null_pct: float, unique_pct: float,
                                   inferred_type: str, issues: List[str]) -> float:
@@ -236,7 +433,8 @@ class IntelligentDataProfiler:
         return max(0, min(100, score))
 
     def _recommend_for_key(self, is_unique: bool, inferred_type: str,
-                           null_pct: float, unique_pct: float, issues: List[str]) -> bool:
+                           null_pct: float, unique_pct: float, issues: List[str],
+                           issue_flags: int = 0) -> bool:
         """Determine if column is recommended as a key."""
         # Must be highly unique
         if not is_unique or unique_pct < 95:
@@ -255,22 +453,46 @@ class IntelligentDataProfiler:
             return False
 
         # No duplicate issues
-        if any('Duplicate' in issue for issue in issues):
+        if issue_flags & IssueFlag.DUPLICATE:
             return False
 
         return True
 
-    def profile_dataset(self, df: pd.DataFrame, dataset_name: str = "Dataset") -> DatasetProfile:
-        """Profile entire dataset comprehensively."""
+    def profile_dataset(self, df: Any, dataset_name: str = "Dataset") -> DatasetProfile:
+        """
+        Profile entire dataset comprehensively.
+
+        Accepts a pandas DataFrame, a Polars DataFrame or LazyFrame, a PyArrow
+        Table, or (with narwhals installed) any frame Narwhals supports.
+        Non-pandas frames are viewed as Arrow-backed pandas columns without
+        copying them into object/NumPy blocks.
+        """
+        df = _as_pandas(df)
         logger.info(f"Profiling {dataset_name} with {len(df)} rows and {len(df.columns)} columns...")
 
-        # Profile each column
-        column_profiles = {}
-        for col in df.columns:
+        # Gather per-column statistics in one pass where possible
+        batch_stats = self._batch_column_stats(df)
+        self._add_numeric_stats(df, batch_stats)
+
+        def profile(col) -> Optional[ColumnProfile]:
             try:
-                column_profiles[col] = self.profile_column(df, col)
+                return self.profile_column(df, col, batch_stats.get(col))
             except Exception as e:
                 logger.error(f"Error profiling column {col}: {str(e)}")
+                return None
+
+        # Profile each column; columns are independent and the pandas/NumPy
+        # kernels release the GIL, so they run on a thread pool
+        workers = max(1, min(len(df.columns), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(profile, df.columns))
+
+        column_profiles = {}
+        quality_sum = 0.0
+        for col, column_profile in zip(df.columns, results):
+            if column_profile is not None:
+                column_profiles[col] = column_profile
+                quality_sum += column_profile.data_quality_score
 
         # Find candidate key columns
         candidate_keys = self._find_candidate_keys(df, column_profiles)
@@ -282,7 +504,7 @@ class IntelligentDataProfiler:
         data_quality_issues = self._identify_data_quality_issues(column_profiles)
 
         # Overall quality score
-        overall_quality = np.mean([p.data_quality_score for p in column_profiles.values()])
+        overall_quality = quality_sum / len(column_profiles) if column_profiles else float('nan')
 
         profile = DatasetProfile(
             row_count=len(df),
@@ -297,6 +519,89 @@ class IntelligentDataProfiler:
         logger.info(f"{dataset_name} profiling complete. Quality score: {overall_quality:.1f}/100")
         return profile
 
+    def _batch_column_stats(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """
+        Compute the per-column statistics used by profile_column in one Polars query.
+
+        Every statistic for every column is a sibling expression in a single
+        select, so Polars scans each column once and spreads the work across
+        cores. Columns Polars cannot convert (e.g. mixed-type objects) are
+        left out and profiled with pandas. Returns {} without polars.
+        """
+        if not POLARS_AVAILABLE or not df.columns.is_unique:
+            return {}
+
+        series = []
+        for i, col_name in enumerate(df.columns):
+            try:
+                series.append((col_name, pl.from_pandas(df[col_name]).alias(f'c{i}')))
+            except Exception:
+                logger.debug(f"Column {col_name} not convertible to Polars, using pandas")
+        if not series:
+            return {}
+
+        exprs = []
+        for col_name, s in series:
+            col = pl.col(s.name)
+            present = col.drop_nulls()
+            exprs += [
+                col.null_count().alias(f'{s.name}|null_count'),
+                present.n_unique().alias(f'{s.name}|unique_count'),
+                (pl.len() - col.n_unique()).alias(f'{s.name}|dup_count'),
+            ]
+            pd_dtype = df[col_name].dtype
+            if _is_text_dtype(pd_dtype) and s.dtype == pl.String:
+                exprs += [
+                    (present.str.strip_chars() != present).sum().alias(f'{s.name}|whitespace_count'),
+                    present.str.to_lowercase().n_unique().alias(f'{s.name}|lower_unique_count'),
+                    present.str.len_chars().mean().alias(f'{s.name}|avg_len'),
+                    present.str.contains(_SPECIAL_CHAR_RE.pattern).sum().alias(f'{s.name}|special_count'),
+                ]
+            elif pd.api.types.is_numeric_dtype(pd_dtype) and not pd.api.types.is_bool_dtype(pd_dtype):
+                exprs += [
+                    col.quantile(0.25, interpolation='linear').alias(f'{s.name}|q1'),
+                    col.quantile(0.75, interpolation='linear').alias(f'{s.name}|q3'),
+                    (col < 0).sum().alias(f'{s.name}|negative_count'),
+                    col.min().alias(f'{s.name}|min'),
+                    col.max().alias(f'{s.name}|max'),
+                ]
+
+        row = pl.DataFrame([s for _, s in series]).lazy().select(exprs).collect().row(0, named=True)
+
+        names = {s.name: col_name for col_name, s in series}
+        stats: Dict[str, Dict[str, Any]] = {col_name: {} for col_name, _ in series}
+        for key, value in row.items():
+            alias, stat = key.split('|', 1)
+            stats[names[alias]][stat] = value
+        return stats
+
+    def _add_numeric_stats(self, df: pd.DataFrame, stats: Dict[str, Dict[str, Any]]):
+        """
+        Fill in quartiles, extremes and negative counts for numeric columns still missing them.
+
+        One DataFrame.quantile call covers every column, instead of two
+        quantile calls (two sorts) per column in _detect_column_issues.
+        """
+        if not df.columns.is_unique:
+            return
+
+        numeric = df.select_dtypes(include='number')
+        missing = [name for name in numeric.columns if 'q1' not in stats.get(name, {})]
+        if not missing:
+            return
+
+        numeric = numeric[missing]
+        quartiles = numeric.quantile([0.25, 0.75])
+        negatives = (numeric < 0).sum()
+        minimums, maximums = numeric.min(), numeric.max()
+        for name in missing:
+            col_stats = stats.setdefault(name, {})
+            col_stats['q1'] = quartiles.at[0.25, name]
+            col_stats['q3'] = quartiles.at[0.75, name]
+            col_stats['negative_count'] = int(negatives[name])
+            col_stats['min'] = minimums[name]
+            col_stats['max'] = maximums[name]
+
     def _find_candidate_keys(self, df: pd.DataFrame,
                              column_profiles: Dict[str, ColumnProfile]) -> List[List[str]]:
         """Find candidate key columns (single or composite)."""
@@ -313,10 +618,18 @@ class IntelligentDataProfiler:
             if profile.unique_percentage > 80 and profile.null_percentage < 10
         ]
 
+        # Factorize each column once; a pair is then a packed uint64 per row.
+        # Missing values get their own code, matching drop_duplicates.
+        codes = {
+            name: pd.factorize(df[name], use_na_sentinel=False)[0].astype(np.uint64)
+            for name in high_unique_cols
+        }
+
         for i, col1 in enumerate(high_unique_cols):
             for col2 in high_unique_cols[i+1:]:
                 # Check if combination is unique
-                combo_unique = df[[col1, col2]].drop_duplicates().shape[0]
+                packed = (codes[col1] << np.uint64(32)) | codes[col2]
+                combo_unique = len(np.unique(packed))
                 combo_unique_pct = (combo_unique / len(df)) * 100
                 if combo_unique_pct >= 95:
                     candidates.append([col1, col2])
@@ -341,7 +654,7 @@ class IntelligentDataProfiler:
                 })
 
             # Whitespace trimming
-            if any('Whitespace' in issue for issue in profile.issues):
+            if profile.issue_flags & IssueFlag.WHITESPACE:
                 transformations.append({
                     'column': col_name,
                     'transformation': 'trim_whitespace',
@@ -350,7 +663,7 @@ class IntelligentDataProfiler:
                 })
 
             # Case normalization
-            if any('Case inconsistency' in issue for issue in profile.issues):
+            if profile.issue_flags & IssueFlag.CASE:
                 transformations.append({
                     'column': col_name,
                     'transformation': 'normalize_case',
@@ -386,7 +699,7 @@ class IntelligentDataProfiler:
                 })
 
             # Duplicates in ID columns
-            if profile.inferred_type == 'id' and any('Duplicate' in issue for issue in profile.issues):
+            if profile.inferred_type == 'id' and profile.issue_flags & IssueFlag.DUPLICATE:
                 critical_issues.append({
                     'severity': 'critical',
                     'column': col_name,
@@ -402,7 +715,28 @@ class IntelligentDataProfiler:
         """
         Suggest optimal reconciliation strategy based on dataset profiles.
         This is the intelligent recommendation engine.
+
+        Results are memoised per (source_profile, target_profile) pair of
+        objects, so repeated calls with the same profiles are free. Profiles
+        are treated as immutable: profile the data again after changing it
+        rather than editing a profile in place. Each call returns its own copy.
         """
+        key = (id(source_profile), id(target_profile))
+        cached = self._strategy_cache.get(key)
+        if cached is None:
+            strategy = self._build_strategy(source_profile, target_profile)
+            # Holding the profiles keeps their ids from being reused while cached
+            self._strategy_cache[key] = (source_profile, target_profile, strategy)
+            if len(self._strategy_cache) > self.strategy_cache_size:
+                self._strategy_cache.popitem(last=False)
+        else:
+            self._strategy_cache.move_to_end(key)
+            strategy = cached[2]
+        return copy.deepcopy(strategy)
+
+    def _build_strategy(self, source_profile: DatasetProfile,
+                        target_profile: DatasetProfile) -> Dict[str, Any]:
+        """Compute the strategy for suggest_reconciliation_strategy (uncached)."""
         logger.info("Analyzing datasets to suggest optimal reconciliation strategy...")
 
         # Find common columns
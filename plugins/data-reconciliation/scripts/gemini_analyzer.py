@@ -6,9 +6,97 @@ Use this when Python analysis needs enhancement with AI insights.
 
 import google.generativeai as genai
 import pandas as pd
+import numpy as np
 import json
-from typing import Dict, List, Any, Optional
+import re
+import hashlib
+import logging
+import math
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
 import os
+import sys
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from datasketch import LeanMinHash, MinHash
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Model clients shared by every analyzer with the same model. The API key is
+# not part of the key: genai.configure sets it process-wide for all clients.
+_MODEL_CACHE: Dict[str, Any] = {}
+_MODEL_LOCK = threading.Lock()
+
+# Responses are cached on disk, keyed by a hash of model, prompt version and prompt
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'finsight' / 'gemini'
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
+# Mismatch samples whose rows overlap at least this much share one analysis
+SEMANTIC_THRESHOLD = 0.9
+MINHASH_PERMUTATIONS = 128
+
+# Fewer mismatches than this are answered without asking the model for patterns
+MIN_MISMATCHES_FOR_PATTERNS = 3
+
+# Short names for the describe() percentiles in prompts
+_STAT_NAMES = {'25%': 'p25', '50%': 'p50', '75%': 'p75'}
+# describe() rows that are counts, shown exactly rather than to 4 significant digits
+_COUNT_STATS = ('count', 'unique', 'freq')
+
+# Models often wrap JSON answers in a markdown code fence
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+def _dumps(obj: Any, indent: bool = True, sort_keys: bool = False) -> str:
+    """Serialize prompt payloads, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys, default=str)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _extract_json(text: str) -> Any:
+    """Parse a JSON answer, unwrapping a markdown code fence if present."""
+    match = _FENCE_RE.search(text)
+    return _loads((match.group(1) if match else text).strip())
+
+
+def _sample_records(df: pd.DataFrame, size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Draw up to `size` rows spread across the frame as a list of dicts.
+    
+    A seeded generator keeps the sample (and therefore the prompt cache key)
+    stable between runs. Rows keep their original order.
+    """
+    if len(df) > size:
+        idx = np.random.default_rng(seed).choice(len(df), size=size, replace=False)
+        df = df.take(np.sort(idx))
+    columns = df.columns.tolist()
+    return [dict(zip(columns, row)) for row in df.to_numpy(dtype=object).tolist()]
 
 
 class GeminiReconciliationAnalyzer:
@@ -19,19 +107,197 @@ class GeminiReconciliationAnalyzer:
     - Data quality insights
     - Anomaly detection explanations
     - Reconciliation strategy recommendations
+    
+    Responses are cached on disk for `cache_ttl` seconds, so re-running an
+    analysis on the same data does not call the API again.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Bump when prompt templates change so cached responses are not reused
+    PROMPT_VERSION = 'v2'
+    # Default model; pass model_name to use another
+    MODEL_NAME = 'gemini-1.5-flash'
+    
+    def __init__(self, api_key: Optional[str] = None,
+                 cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR,
+                 cache_ttl: float = DEFAULT_CACHE_TTL,
+                 stream: bool = False,
+                 model_name: str = MODEL_NAME):
         """
         Initialize Gemini AI client.
         API key from environment variable GEMINI_API_KEY or parameter.
+        
+        Args:
+            cache_dir: Directory for cached responses (None disables caching)
+            cache_ttl: Age in seconds after which a cached response is ignored
+            stream: Stream responses and print a progress dot to stderr per
+                chunk (meant for interactive scripts; the dots of concurrent
+                calls interleave); False waits for the complete response silently
+            model_name: Gemini model to use
+        
+        Analyzers with the same model share one client, so creating them
+        repeatedly (e.g. in a notebook loop) is cheap. The API key is
+        process-global (genai.configure): the most recently created
+        analyzer's key is used by every analyzer in the process.
         """
         api_key = api_key or os.getenv('GEMINI_API_KEY')
         if not api_key:
             raise ValueError("Gemini API key required. Set GEMINI_API_KEY or pass api_key parameter")
         
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        self.model_name = model_name
+        with _MODEL_LOCK:
+            genai.configure(api_key=api_key)
+            model = _MODEL_CACHE.get(model_name)
+            if model is None:
+                model = _MODEL_CACHE[model_name] = genai.GenerativeModel(model_name)
+        self.model = model
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
+        self.stream = stream
+    
+    def _generate(self, prompt: str) -> str:
+        """Call the model and return its full response text."""
+        if not self.stream:
+            return self.model.generate_content(prompt).text
+        
+        chunks = []
+        for chunk in self.model.generate_content(prompt, stream=True):
+            chunks.append(chunk.text)
+            sys.stderr.write('.')
+            sys.stderr.flush()
+        sys.stderr.write('\n')
+        return ''.join(chunks)
+    
+    def _cached_generate(self, prompt: str) -> str:
+        """Return the model's text for `prompt`, from the disk cache when fresh."""
+        if self.cache_dir is None:
+            return self._generate(prompt)
+        
+        key = hashlib.blake2b(
+            f"{self.model_name}\0{self.PROMPT_VERSION}\0{prompt}".encode(), digest_size=16
+        ).hexdigest()
+        cache_file = self.cache_dir / f"{key}.json"
+        
+        try:
+            entry = _loads(cache_file.read_text(encoding='utf-8'))
+            if time.time() - entry['created_at'] <= self.cache_ttl:
+                return entry['response']
+        except (OSError, ValueError, KeyError):
+            pass  # missing, unreadable or stale entry
+        
+        text = self._generate(prompt)
+        
+        self._write_cache_file(cache_file, {
+            "prompt": prompt,
+            "response": text,
+            "created_at": time.time(),
+            "model": self.model_name,
+            "prompt_version": self.PROMPT_VERSION,
+        })
+        
+        return text
+    
+    def _write_cache_file(self, cache_file: Path, entry: Any):
+        """Atomically write a JSON cache entry; failures are logged, not raised."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(_dumps(entry, indent=False))
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write Gemini cache entry {cache_file}: {str(e)}")
+    
+    def _mismatch_fingerprint(self, summary: Dict[str, Any], context: str = "") -> tuple:
+        """
+        Structural key and row set for the mismatch summary built by
+        `analyze_mismatch_patterns`.
+        
+        The key ignores row order and exact counts, so small data changes
+        land in the same bucket and are then compared by row overlap. Everything
+        else the prompt carries (the caller's context, the per-column
+        distribution) is part of the key.
+        """
+        records = summary['sample_mismatches']
+        value_types = sorted(
+            (str(rec.get('column')),
+             type(rec.get('source_value')).__name__,
+             type(rec.get('target_value')).__name__)
+            for rec in records
+        )
+        structure = {
+            "model": self.model_name,
+            "prompt_version": self.PROMPT_VERSION,
+            "columns": sorted(map(str, summary['columns_affected'])),
+            "size_bucket": int(math.log2(summary['total_mismatches'])),
+            "column_buckets": sorted(
+                (str(col), int(math.log2(n))) for col, n in summary['per_column_counts'].items()
+            ),
+            "context": hashlib.blake2b(context.encode(), digest_size=16).hexdigest(),
+            "value_types": value_types,
+        }
+        key = hashlib.blake2b(
+            _dumps(structure, indent=False, sort_keys=True).encode(), digest_size=16
+        ).hexdigest()
+        rows = {_dumps(rec, indent=False, sort_keys=True) for rec in records}
+        return key, rows
+    
+    def _row_signature(self, rows: set) -> List[int]:
+        """MinHash signature of a row set, or exact row hashes without datasketch."""
+        if DATASKETCH_AVAILABLE:
+            minhash = MinHash(num_perm=MINHASH_PERMUTATIONS)
+            minhash.update_batch([row.encode() for row in rows])
+            return LeanMinHash(minhash).hashvalues.tolist()
+        return sorted(
+            int.from_bytes(hashlib.blake2b(row.encode(), digest_size=8).digest(), 'little')
+            for row in rows
+        )
+    
+    @staticmethod
+    def _signature_similarity(a: List[int], b: List[int]) -> float:
+        """Estimated Jaccard similarity of two signatures from `_row_signature`."""
+        if DATASKETCH_AVAILABLE:
+            if len(a) != len(b):
+                return 0.0
+            return sum(x == y for x, y in zip(a, b)) / len(a)
+        set_a, set_b = set(a), set(b)
+        union = set_a | set_b
+        return len(set_a & set_b) / len(union) if union else 1.0
+    
+    def _semantic_lookup(self, key: str, signature: List[int]) -> Optional[str]:
+        """Return the cached response closest to `signature`, if similar enough."""
+        if self.cache_dir is None:
+            return None
+        try:
+            entries = _loads((self.cache_dir / 'semantic' / f"{key}.json").read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        
+        now = time.time()
+        best_score, best_response = 0.0, None
+        for entry in entries:
+            if now - entry.get('created_at', 0) > self.cache_ttl:
+                continue
+            score = self._signature_similarity(signature, entry.get('signature', []))
+            if score > best_score:
+                best_score, best_response = score, entry.get('response')
+        
+        return best_response if best_score >= SEMANTIC_THRESHOLD else None
+    
+    def _semantic_store(self, key: str, signature: List[int], text: str):
+        """Add a response to the semantic bucket for `key`, dropping expired entries."""
+        if self.cache_dir is None:
+            return
+        cache_file = self.cache_dir / 'semantic' / f"{key}.json"
+        try:
+            entries = _loads(cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            entries = []
+        
+        now = time.time()
+        entries = [entry for entry in entries if now - entry.get('created_at', 0) <= self.cache_ttl]
+        entries.append({"signature": signature, "response": text, "created_at": now})
+        self._write_cache_file(cache_file, entries)
     
     def analyze_mismatch_patterns(self, mismatches_df: pd.DataFrame, context: str = "") -> Dict[str, Any]:
         """
@@ -44,16 +310,23 @@ class GeminiReconciliationAnalyzer:
         """
         if mismatches_df.empty:
             return {"patterns": [], "insights": "No mismatches to analyze"}
+        if len(mismatches_df) < MIN_MISMATCHES_FOR_PATTERNS:
+            return {
+                "patterns": [],
+                "insights": f"Only {len(mismatches_df)} mismatch{'es' if len(mismatches_df) > 1 else ''}; "
+                            "too few to identify patterns"
+            }
         
         # Prepare data summary (sample for large datasets)
         sample_size = min(100, len(mismatches_df))
-        sample = mismatches_df.head(sample_size)
         
-        # Create structured summary
+        # Create structured summary; one value_counts pass gives both the columns and their counts
+        counts = mismatches_df['column'].value_counts()
         summary = {
             "total_mismatches": len(mismatches_df),
-            "columns_affected": mismatches_df['column'].unique().tolist(),
-            "sample_mismatches": sample.to_dict('records')
+            "columns_affected": counts.index.tolist(),
+            "per_column_counts": counts.to_dict(),
+            "sample_mismatches": _sample_records(mismatches_df, sample_size)
         }
         
         prompt = f"""Analyze these data reconciliation mismatches and identify patterns:
@@ -62,10 +335,11 @@ Context: {context}
 
 Summary:
 - Total mismatches: {summary['total_mismatches']}
-- Columns affected: {', '.join(summary['columns_affected'])}
+- Columns affected: {', '.join(map(str, summary['columns_affected']))}
+- Mismatches per column: {', '.join(f'{col}={n}' for col, n in summary['per_column_counts'].items())}
 
-Sample mismatches (first {sample_size}):
-{json.dumps(summary['sample_mismatches'], indent=2, default=str)}
+Sample mismatches ({sample_size} sampled across all mismatches):
+{_dumps(summary['sample_mismatches'])}
 
 Please provide:
 1. **Common patterns**: What patterns do you see in the mismatches?
@@ -76,22 +350,19 @@ Please provide:
 Format as JSON with keys: patterns, root_causes, data_quality_issues, recommendations
 """
         
-        response = self.model.generate_content(prompt)
+        # Reuse an analysis of a near-identical sample before asking the model
+        key, rows = self._mismatch_fingerprint(summary, context)
+        signature = self._row_signature(rows)
+        text = self._semantic_lookup(key, signature)
+        if text is None:
+            text = self._cached_generate(prompt)
+            self._semantic_store(key, signature, text)
         
         try:
-            # Extract JSON from response
-            text = response.text
-            # Remove markdown code blocks if present
-            if '```json' in text:
-                text = text.split('```json')[1].split('```')[0]
-            elif '```' in text:
-                text = text.split('```')[1].split('```')[0]
-            
-            analysis = json.loads(text.strip())
-            return analysis
-        except:
+            return _extract_json(text)
+        except ValueError:
             # Fallback to text response if JSON parsing fails
-            return {"analysis": response.text}
+            return {"analysis": text}
     
     def analyze_unmatched_records(self, 
                                   unmatched_source: pd.DataFrame, 
@@ -105,18 +376,31 @@ Format as JSON with keys: patterns, root_causes, data_quality_issues, recommenda
         - Looking for data entry patterns or timing issues
         - Require insights on data synchronization problems
         """
-        source_sample = unmatched_source.head(50).to_dict('records')
-        target_sample = unmatched_target.head(50).to_dict('records')
+        if unmatched_source.empty and unmatched_target.empty:
+            return {
+                "likely_causes": [],
+                "business_insights": "All records matched",
+                "sync_issues": [],
+                "investigation_steps": []
+            }
+        
+        # Only describe the sides that have unmatched records
+        sections = []
+        for side, unmatched in (("Source", unmatched_source), ("Target", unmatched_target)):
+            if unmatched.empty:
+                sections.append(f"Unmatched in {side}: none, every {side.lower()} record matched")
+            else:
+                sample = _sample_records(unmatched, 50)
+                sections.append(
+                    f"Unmatched in {side} ({len(unmatched)} total, showing {len(sample)}):\n{_dumps(sample)}"
+                )
+        records_text = "\n\n".join(sections)
         
         prompt = f"""Analyze unmatched records from data reconciliation:
 
 Context: {context}
 
-Unmatched in Source ({len(unmatched_source)} total, showing first 50):
-{json.dumps(source_sample, indent=2, default=str)}
-
-Unmatched in Target ({len(unmatched_target)} total, showing first 50):
-{json.dumps(target_sample, indent=2, default=str)}
+{records_text}
 
 Provide insights on:
 1. Why these records might not match
@@ -127,18 +411,12 @@ Provide insights on:
 Format as JSON with keys: likely_causes, business_insights, sync_issues, investigation_steps
 """
         
-        response = self.model.generate_content(prompt)
+        text = self._cached_generate(prompt)
         
         try:
-            text = response.text
-            if '```json' in text:
-                text = text.split('```json')[1].split('```')[0]
-            elif '```' in text:
-                text = text.split('```')[1].split('```')[0]
-            
-            return json.loads(text.strip())
-        except:
-            return {"analysis": response.text}
+            return _extract_json(text)
+        except ValueError:
+            return {"analysis": text}
     
     def suggest_reconciliation_strategy(self, 
                                        source_info: Dict[str, Any],
@@ -156,12 +434,12 @@ Format as JSON with keys: likely_causes, business_insights, sync_issues, investi
 Source System: {source_info.get('name', 'Unknown')}
 - Columns: {source_info.get('columns', [])}
 - Record count: {source_info.get('record_count', 0)}
-- Sample data: {json.dumps(source_info.get('sample', []), indent=2, default=str)}
+- Sample data: {_dumps(source_info.get('sample', []))}
 
 Target System: {target_info.get('name', 'Unknown')}
 - Columns: {target_info.get('columns', [])}
 - Record count: {target_info.get('record_count', 0)}
-- Sample data: {json.dumps(target_info.get('sample', []), indent=2, default=str)}
+- Sample data: {_dumps(target_info.get('sample', []))}
 
 Provide:
 1. **Key columns**: Which columns should be used as matching keys?
@@ -173,18 +451,12 @@ Provide:
 Format as JSON with keys: key_columns, compare_columns, transformations, tolerances, special_considerations
 """
         
-        response = self.model.generate_content(prompt)
+        text = self._cached_generate(prompt)
         
         try:
-            text = response.text
-            if '```json' in text:
-                text = text.split('```json')[1].split('```')[0]
-            elif '```' in text:
-                text = text.split('```')[1].split('```')[0]
-            
-            return json.loads(text.strip())
-        except:
-            return {"strategy": response.text}
+            return _extract_json(text)
+        except ValueError:
+            return {"strategy": text}
     
     def explain_discrepancy(self, 
                            source_value: Any, 
@@ -198,27 +470,98 @@ Format as JSON with keys: key_columns, compare_columns, transformations, toleran
         - Need to explain complex discrepancies to non-technical stakeholders
         - Value differences require business context interpretation
         - Debugging individual high-priority mismatches
+        
+        For more than one discrepancy use `explain_discrepancies`, which
+        explains a whole batch in one request.
+        """
+        row = pd.DataFrame({
+            'column': [column_name],
+            'source_value': [source_value],
+            'target_value': [target_value],
+        })
+        return self.explain_discrepancies(row, context=context).iloc[0]
+    
+    def explain_discrepancies(self,
+                              rows: pd.DataFrame,
+                              column_col: str = 'column',
+                              src_col: str = 'source_value',
+                              tgt_col: str = 'target_value',
+                              context: Dict[str, Any] = None,
+                              batch_size: int = 50) -> pd.Series:
+        """
+        Explain many discrepancies in business terms with one request per batch.
+        
+        Rows are grouped by column and sent `batch_size` at a time. Returns a
+        Series of explanations aligned with `rows.index`. If an answer can't be
+        parsed, every row in that batch gets the raw response text.
         """
-        context_str = json.dumps(context, indent=2, default=str) if context else "None provided"
+        explanations = [None] * len(rows)
+        if rows.empty:
+            return pd.Series(explanations, index=rows.index, dtype=object)
+        
+        context_str = _dumps(context) if context else "None provided"
+        source_values = rows[src_col].to_numpy(dtype=object)
+        target_values = rows[tgt_col].to_numpy(dtype=object)
         
-        prompt = f"""Explain this data discrepancy in clear business terms:
+        groups = rows.groupby(column_col, sort=False, dropna=False).indices
+        for column_name, positions in groups.items():
+            for start in range(0, len(positions), batch_size):
+                batch = positions[start:start + batch_size]
+                pairs = "\n".join(
+                    f"{i}. Source value: {source_values[pos]} | Target value: {target_values[pos]}"
+                    for i, pos in enumerate(batch, 1)
+                )
+                
+                prompt = f"""Explain these data discrepancies in clear business terms:
 
 Column: {column_name}
-Source value: {source_value}
-Target value: {target_value}
 Additional context: {context_str}
 
-Provide:
+Discrepancies:
+{pairs}
+
+For each discrepancy provide:
 1. A clear explanation of the discrepancy
 2. Possible business reasons for the difference
 3. Whether this is likely a data quality issue or a timing/process difference
 4. Recommended action
 
-Keep it concise and business-focused.
+Keep each explanation concise and business-focused.
+Format as a JSON array of objects with keys: index, explanation
 """
+                
+                text = self._cached_generate(prompt)
+                
+                try:
+                    answers = {int(item['index']): item['explanation'] for item in _extract_json(text)}
+                except (ValueError, TypeError, KeyError):
+                    answers = {}
+                    logger.warning(f"Could not parse batched explanations for column '{column_name}'")
+                
+                for i, pos in enumerate(batch, 1):
+                    explanations[pos] = answers.get(i, text)
+        
+        return pd.Series(explanations, index=rows.index, dtype=object)
+    
+    def analyze_all(self,
+                    mismatches_df: pd.DataFrame,
+                    unmatched_source: pd.DataFrame,
+                    unmatched_target: pd.DataFrame,
+                    context: str = "") -> Dict[str, Any]:
+        """
+        Run the mismatch and unmatched-record analyses concurrently.
         
-        response = self.model.generate_content(prompt)
-        return response.text
+        The two requests are independent, so their network latency overlaps.
+        Returns a dict with `mismatch_patterns` and `unmatched_records` keys.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            patterns = executor.submit(self.analyze_mismatch_patterns, mismatches_df, context)
+            unmatched = executor.submit(self.analyze_unmatched_records,
+                                        unmatched_source, unmatched_target, context)
+            return {
+                "mismatch_patterns": patterns.result(),
+                "unmatched_records": unmatched.result(),
+            }
     
     def detect_anomalies(self, data: pd.DataFrame, column: str) -> Dict[str, Any]:
         """
@@ -228,16 +571,39 @@ Keep it concise and business-focused.
         - Need semantic anomaly detection beyond statistical outliers
         - Looking for business logic violations
         - Require contextual understanding of what's "normal"
+        
+        To check several columns use `detect_anomalies_batch`, which
+        summarizes them all in one pass.
         """
-        # Get statistical summary
-        stats = data[column].describe().to_dict()
-        sample = data[column].dropna().head(100).tolist()
+        return self.detect_anomalies_batch(data, [column])[column]
+    
+    def detect_anomalies_batch(self, data: pd.DataFrame, columns: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run `detect_anomalies` for several columns of one frame.
+        
+        The summary statistics for all columns come from a single
+        describe(include='all') call. Returns a dict keyed by column name.
+        """
+        # Rows that don't apply to a column's dtype (e.g. 'top' for numbers) come back as NaN
+        descriptions = data[columns].describe(include='all')
         
-        prompt = f"""Analyze this data column for anomalies:
+        results = {}
+        for column in columns:
+            stats = descriptions[column].dropna()
+            # Get statistical summary as one compact line, e.g. "count=120 mean=45.2 ... max=990"
+            stats_line = " ".join(
+                f"{name}={value:.0f}" if name in _COUNT_STATS
+                else f"{_STAT_NAMES.get(name, name)}={value:.4g}" if isinstance(value, (int, float, np.number))
+                else f"{_STAT_NAMES.get(name, name)}={value}"
+                for name, value in stats.items()
+            )
+            sample = data[column].dropna().head(100).to_numpy().tolist()
+            
+            prompt = f"""Analyze this data column for anomalies:
 
 Column: {column}
-Statistics: {json.dumps(stats, indent=2, default=str)}
-Sample values (first 100): {sample}
+Statistics: {stats_line}
+Sample values (first 100): {", ".join(map(str, sample))}
 
 Identify:
 1. **Anomalies**: Values or patterns that seem unusual
@@ -247,25 +613,21 @@ Identify:
 
 Format as JSON with keys: anomalies, business_concerns, data_quality, recommendations
 """
-        
-        response = self.model.generate_content(prompt)
-        
-        try:
-            text = response.text
-            if '```json' in text:
-                text = text.split('```json')[1].split('```')[0]
-            elif '```' in text:
-                text = text.split('```')[1].split('```')[0]
             
-            return json.loads(text.strip())
-        except:
-            return {"analysis": response.text}
+            text = self._cached_generate(prompt)
+            
+            try:
+                results[column] = _extract_json(text)
+            except ValueError:
+                results[column] = {"analysis": text}
+        
+        return results
 
 
 # Example usage
 if __name__ == "__main__":
-    # Initialize analyzer
-    analyzer = GeminiReconciliationAnalyzer()
+    # Initialize analyzer, showing progress while responses stream in
+    analyzer = GeminiReconciliationAnalyzer(stream=True)
     
     # Example: Analyze mismatch patterns
     mismatches = pd.DataFrame({
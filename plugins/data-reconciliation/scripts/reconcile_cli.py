@@ -5,22 +5,18 @@ Automatically analyzes data and recommends optimal reconciliation strategy.
 """
 
 import click
-import pandas as pd
-import json
+import functools
+import os
+import pickle
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import logging
-from colorama import Fore, Style, init
-from tabulate import tabulate
 
-# Initialize colorama for cross-platform colored terminal
-init(autoreset=True)
-
-from data_loader import DataLoader
-from data_profiler import IntelligentDataProfiler
-from reconcile_engine import ReconciliationEngine, ReconciliationConfig
-from visualizer import ReconciliationVisualizer
+# pandas, colorama, tabulate and the reconciliation modules are imported inside
+# the commands that use them, so `--help` and `version` start instantly
 
 # Setup logging
 logging.basicConfig(
@@ -29,34 +25,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Dataset profiles of unchanged files are reused across runs
+PROFILE_CACHE_DIR = Path.home() / '.cache' / 'finsight' / 'profile'
+# Bump when the profiler output changes so stale pickles are ignored
+PROFILE_CACHE_VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _colors():
+    """Import and initialize colorama on first use; returns (Fore, Style)."""
+    from colorama import Fore, Style, init
+    # Initialize colorama for cross-platform colored terminal
+    init(autoreset=True)
+    return Fore, Style
+
 
 def print_success(message: str):
     """Print success message in green."""
+    Fore, Style = _colors()
     click.echo(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
 
 
 def print_error(message: str):
     """Print error message in red."""
+    Fore, Style = _colors()
     click.echo(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
 
 
 def print_warning(message: str):
     """Print warning message in yellow."""
+    Fore, Style = _colors()
     click.echo(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
 
 
 def print_info(message: str):
     """Print info message in cyan."""
+    Fore, Style = _colors()
     click.echo(f"{Fore.CYAN}ℹ {message}{Style.RESET_ALL}")
 
 
 def print_section(title: str):
     """Print section header."""
+    Fore, Style = _colors()
     click.echo(f"\n{Fore.BLUE}{'='*70}")
     click.echo(f"{Fore.BLUE}{title:^70}")
     click.echo(f"{Fore.BLUE}{'='*70}{Style.RESET_ALL}\n")
 
 
+def profile_with_cache(profiler: 'IntelligentDataProfiler', df: 'pd.DataFrame',
+                       source: str, name: str) -> 'DatasetProfile':
+    """
+    Profile a dataset loaded from `source`, reusing a cached profile when the
+    same data was profiled before.
+    
+    The cache key is a content fingerprint of the frame, so it holds no
+    matter how or from where the data was loaded, and any change to the data
+    invalidates it.
+    """
+    from data_profiler import DatasetProfile, df_fingerprint
+
+    try:
+        fingerprint = df_fingerprint(df)
+    except TypeError:
+        # Unhashable cell values (e.g. nested JSON lists) can't be fingerprinted
+        return profiler.profile_dataset(df, name)
+    cache_file = PROFILE_CACHE_DIR / f"v{PROFILE_CACHE_VERSION}-{fingerprint}.pkl"
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            profile = pickle.load(f)
+        if isinstance(profile, DatasetProfile):
+            logger.info(f"Using cached profile for {source}")
+            return profile
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+        pass  # no usable cached profile
+    
+    profile = profiler.profile_dataset(df, name)
+    
+    try:
+        PROFILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so a concurrent run never reads a partial pickle
+        fd, tmp_path = tempfile.mkstemp(dir=PROFILE_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(profile, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not cache profile for {source}: {str(e)}")
+    
+    return profile
+
+
 @click.group()
 def cli():
     """Intelligent Data Reconciliation Tool - Automatically analyzes and reconciles datasets."""
@@ -70,7 +128,7 @@ def cli():
 @click.option('--key-columns', '-k', multiple=True, help='Key columns for matching')
 @click.option('--compare-columns', '-c', multiple=True, help='Columns to compare')
 @click.option('--output', '-o', default='reconciliation_output', help='Output directory')
-@click.option('--format', '-f', type=click.Choice(['csv', 'excel', 'both']), default='both',
+@click.option('--format', '-f', type=click.Choice(['csv', 'excel', 'both', 'parquet']), default='both',
               help='Output format')
 @click.option('--visualize', is_flag=True, help='Generate visualizations')
 @click.option('--interactive', is_flag=True, help='Use interactive mode for confirmation')
@@ -90,16 +148,22 @@ def reconcile(source: str, target: str, auto: bool, key_columns: tuple,
         # With visualization
         reconcile-cli reconcile source.csv target.csv --auto --visualize
     """
+    from tabulate import tabulate
+    from data_loader import DataLoader
+    from data_profiler import IntelligentDataProfiler
+    from reconcile_engine import ReconciliationEngine, ReconciliationConfig
+    Fore, Style = _colors()
+
     try:
         print_section("INTELLIGENT DATA RECONCILIATION")
 
         # Load datasets
         print_info(f"Loading source: {source}")
-        source_df = DataLoader.auto_detect_and_load(source)
+        source_df = DataLoader.load_with_cache(source)
         print_success(f"Loaded {len(source_df)} source records")
 
         print_info(f"Loading target: {target}")
-        target_df = DataLoader.auto_detect_and_load(target)
+        target_df = DataLoader.load_with_cache(target)
         print_success(f"Loaded {len(target_df)} target records")
 
         # Auto mode: Use intelligent profiler
@@ -109,9 +173,12 @@ def reconcile(source: str, target: str, auto: bool, key_columns: tuple,
 
             profiler = IntelligentDataProfiler()
 
-            # Profile both datasets
-            source_profile = profiler.profile_dataset(source_df, "Source")
-            target_profile = profiler.profile_dataset(target_df, "Target")
+            # Profile both datasets concurrently, they are independent
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                source_future = executor.submit(profile_with_cache, profiler, source_df, source, "Source")
+                target_future = executor.submit(profile_with_cache, profiler, target_df, target, "Target")
+                source_profile = source_future.result()
+                target_profile = target_future.result()
 
             # Display data quality summary
             print_section("DATA QUALITY SUMMARY")
@@ -121,7 +188,7 @@ def reconcile(source: str, target: str, auto: bool, key_columns: tuple,
                 ["Target Quality Score", f"{target_profile.overall_quality_score:.1f}/100"],
                 ["Source Rows", f"{source_profile.row_count:,}"],
                 ["Target Rows", f"{target_profile.row_count:,}"],
-                ["Common Columns", len(set(source_df.columns) & set(target_df.columns))]
+                ["Common Columns", len(source_df.columns.intersection(target_df.columns))]
             ]
             click.echo(tabulate(source_quality_data, tablefmt="grid"))
 
@@ -129,10 +196,12 @@ def reconcile(source: str, target: str, auto: bool, key_columns: tuple,
             all_issues = source_profile.data_quality_issues + target_profile.data_quality_issues
             if all_issues:
                 print_warning(f"\nFound {len(all_issues)} data quality issues:")
+                lines = []
                 for issue in all_issues[:5]:  # Show top 5
                     severity_color = Fore.RED if issue['severity'] == 'critical' else Fore.YELLOW
-                    click.echo(f"  {severity_color}[{issue['severity'].upper()}] {issue['column']}: {issue['issue']}{Style.RESET_ALL}")
-                    click.echo(f"    → {issue['recommendation']}")
+                    lines.append(f"  {severity_color}[{issue['severity'].upper()}] {issue['column']}: {issue['issue']}{Style.RESET_ALL}")
+                    lines.append(f"    → {issue['recommendation']}")
+                click.echo("\n".join(lines))
 
             # Get strategy recommendation
             print_section("RECOMMENDED RECONCILIATION STRATEGY")
@@ -147,7 +216,7 @@ def reconcile(source: str, target: str, auto: bool, key_columns: tuple,
             strategy_data = [
                 ["Key Columns", ", ".join(strategy['recommended_key_columns']) or "None found"],
                 ["Compare Columns", ", ".join(strategy['recommended_compare_columns'][:5]) + "..." if len(strategy['recommended_compare_columns']) > 5 else ", ".join(strategy['recommended_compare_columns'])],
-                ["Tolerance Settings", json.dumps(strategy['recommended_tolerance']) if strategy['recommended_tolerance'] else "None"],
+                ["Tolerance Settings", ", ".join(f"{col}={tol}" for col, tol in strategy['recommended_tolerance'].items()) or "None"],
                 ["Strategy Confidence", f"{strategy['confidence']:.0f}%"]
             ]
             click.echo(tabulate(strategy_data, tablefmt="grid"))
@@ -155,8 +224,10 @@ def reconcile(source: str, target: str, auto: bool, key_columns: tuple,
             # Show recommended transformations
             if strategy['recommended_transformations']:
                 print_info(f"\nRecommended {len(strategy['recommended_transformations'])} transformations:")
-                for trans in strategy['recommended_transformations'][:5]:
-                    click.echo(f"  • {trans['column']}: {trans['transformation']} - {trans['reason']}")
+                click.echo("\n".join(
+                    f"  • {trans['column']}: {trans['transformation']} - {trans['reason']}"
+                    for trans in strategy['recommended_transformations'][:5]
+                ))
 
             # Interactive confirmation
             if interactive:
@@ -183,8 +254,9 @@ def reconcile(source: str, target: str, auto: bool, key_columns: tuple,
 
         if not compare_columns:
             print_warning("No compare columns specified. Will compare all common columns except keys.")
-            common_cols = set(source_df.columns) & set(target_df.columns)
-            compare_columns = list(common_cols - set(key_columns))
+            # Index set operations keep the source column order (sets do not)
+            common_cols = source_df.columns.intersection(target_df.columns)
+            compare_columns = common_cols.difference(key_columns, sort=False).tolist()
 
         # Configure reconciliation
         print_section("RECONCILIATION CONFIGURATION")
@@ -241,8 +313,15 @@ def reconcile(source: str, target: str, auto: bool, key_columns: tuple,
         if visualize:
             print_section("GENERATING VISUALIZATIONS")
             print_info("Creating visualizations...")
+            from visualizer import ReconciliationVisualizer
 
-            viz = ReconciliationVisualizer(result)
+            has_mismatches = not result.mismatches.empty
+            if format == 'parquet' and has_mismatches:
+                # Plot from the exported file so the full mismatch frame can be released
+                result.mismatches = None
+                viz = ReconciliationVisualizer(Path(output_path) / "mismatches.parquet")
+            else:
+                viz = ReconciliationVisualizer(result)
 
             # Create dashboard
             dashboard_file = Path(output) / "dashboard.html"
@@ -254,7 +333,7 @@ def reconcile(source: str, target: str, auto: bool, key_columns: tuple,
             viz.create_summary_chart(str(summary_file), interactive=False)
             print_success(f"Summary chart saved to {summary_file}")
 
-            if not result.mismatches.empty:
+            if has_mismatches:
                 mismatch_file = Path(output) / "mismatch_analysis.png"
                 viz.create_mismatch_analysis(str(mismatch_file))
                 print_success(f"Mismatch analysis saved to {mismatch_file}")
@@ -284,17 +363,22 @@ def profile(file_path: str, detailed: bool):
     Example:
         reconcile-cli profile data.csv --detailed
     """
+    from tabulate import tabulate
+    from data_loader import DataLoader
+    from data_profiler import IntelligentDataProfiler
+    Fore, Style = _colors()
+
     try:
         print_section("DATA PROFILING")
 
         # Load dataset
         print_info(f"Loading: {file_path}")
-        df = DataLoader.auto_detect_and_load(file_path)
+        df = DataLoader.load_with_cache(file_path)
         print_success(f"Loaded {len(df)} records with {len(df.columns)} columns")
 
         # Profile
         profiler = IntelligentDataProfiler()
-        profile = profiler.profile_dataset(df, Path(file_path).name)
+        profile = profile_with_cache(profiler, df, file_path, Path(file_path).name)
 
         # Display overview
         print_section("DATASET OVERVIEW")
@@ -309,48 +393,57 @@ def profile(file_path: str, detailed: bool):
         # Display candidate keys
         print_section("CANDIDATE KEY COLUMNS")
         if profile.candidate_key_columns:
-            for i, key in enumerate(profile.candidate_key_columns, 1):
-                click.echo(f"  {i}. {' + '.join(key)}")
+            click.echo("\n".join(
+                f"  {i}. {' + '.join(key)}" for i, key in enumerate(profile.candidate_key_columns, 1)
+            ))
         else:
             print_warning("No candidate key columns found")
 
         # Display column summary
         if detailed:
             print_section("COLUMN PROFILES")
-            for col_name, col_profile in profile.column_profiles.items():
-                click.echo(f"\n{Fore.CYAN}Column: {col_name}{Style.RESET_ALL}")
-                col_data = [
-                    ["Type", col_profile.inferred_type],
-                    ["Unique Values", f"{col_profile.unique_count:,} ({col_profile.unique_percentage:.1f}%)"],
-                    ["Null Values", f"{col_profile.null_count:,} ({col_profile.null_percentage:.1f}%)"],
-                    ["Quality Score", f"{col_profile.data_quality_score:.1f}/100"],
-                    ["Recommended for Key", "Yes" if col_profile.recommended_for_key else "No"]
+            # One table for all columns: rendering it is a single write however wide the frame is
+            col_data = [
+                [
+                    f"{Fore.CYAN}{col_name}{Style.RESET_ALL}",
+                    col_profile.inferred_type,
+                    f"{col_profile.unique_count:,} ({col_profile.unique_percentage:.1f}%)",
+                    f"{col_profile.null_count:,} ({col_profile.null_percentage:.1f}%)",
+                    f"{col_profile.data_quality_score:.1f}/100",
+                    "Yes" if col_profile.recommended_for_key else "No",
+                    "\n".join(f"• {issue}" for issue in col_profile.issues),
                 ]
-                click.echo(tabulate(col_data, tablefmt="plain"))
-
-                if col_profile.issues:
-                    print_warning("  Issues:")
-                    for issue in col_profile.issues:
-                        click.echo(f"    • {issue}")
+                for col_name, col_profile in profile.column_profiles.items()
+            ]
+            click.echo(tabulate(
+                col_data,
+                headers=["Column", "Type", "Unique Values", "Null Values", "Quality Score",
+                         "Recommended for Key", "Issues"],
+                tablefmt="grid"
+            ))
 
         # Display quality issues
         if profile.data_quality_issues:
             print_section("DATA QUALITY ISSUES")
+            lines = []
             for issue in profile.data_quality_issues:
                 severity_color = Fore.RED if issue['severity'] == 'critical' else Fore.YELLOW
-                click.echo(f"{severity_color}[{issue['severity'].upper()}] {issue['column']}{Style.RESET_ALL}")
-                click.echo(f"  Issue: {issue['issue']}")
-                click.echo(f"  Impact: {issue['impact']}")
-                click.echo(f"  Recommendation: {issue['recommendation']}\n")
+                lines.append(f"{severity_color}[{issue['severity'].upper()}] {issue['column']}{Style.RESET_ALL}")
+                lines.append(f"  Issue: {issue['issue']}")
+                lines.append(f"  Impact: {issue['impact']}")
+                lines.append(f"  Recommendation: {issue['recommendation']}\n")
+            click.echo("\n".join(lines))
 
         # Display transformation recommendations
         if profile.recommended_transformations:
             print_section("RECOMMENDED TRANSFORMATIONS")
+            lines = []
             for trans in profile.recommended_transformations:
                 priority_color = Fore.RED if trans['priority'] == 'high' else Fore.YELLOW
-                click.echo(f"{priority_color}[{trans['priority'].upper()}] {trans['column']}{Style.RESET_ALL}")
-                click.echo(f"  Transformation: {trans['transformation']}")
-                click.echo(f"  Reason: {trans['reason']}\n")
+                lines.append(f"{priority_color}[{trans['priority'].upper()}] {trans['column']}{Style.RESET_ALL}")
+                lines.append(f"  Transformation: {trans['transformation']}")
+                lines.append(f"  Reason: {trans['reason']}\n")
+            click.echo("\n".join(lines))
 
     except Exception as e:
         print_error(f"Profiling failed: {str(e)}")
@@ -11,8 +11,24 @@ from dataclasses import dataclass
 from datetime import datetime
 import json
 import logging
+import weakref
 from tqdm import tqdm
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from itertools import repeat
+
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +37,194 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Below this many matched rows a process pool costs more than it saves
+PARALLEL_COMPARE_MIN_ROWS = 500_000
+
+# Rows per Excel worksheet, header included (the .xlsx format limit)
+EXCEL_MAX_ROWS = 1_048_576
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True)
+    def _numeric_mismatch(source, target, tolerance):
+        """Mismatch mask and absolute differences in one compiled pass."""
+        n = source.shape[0]
+        mask = np.empty(n, dtype=np.bool_)
+        diff = np.empty(n, dtype=np.float64)
+        for i in numba.prange(n):
+            source_na = np.isnan(source[i])
+            target_na = np.isnan(target[i])
+            if source_na or target_na:
+                mask[i] = source_na != target_na
+                diff[i] = np.nan
+            else:
+                d = abs(source[i] - target[i])
+                mask[i] = d > tolerance
+                diff[i] = d
+        return mask, diff
+else:
+    def _numeric_mismatch(source, target, tolerance):
+        """Mismatch mask and absolute differences (vectorized numpy)."""
+        source_na = np.isnan(source)
+        target_na = np.isnan(target)
+        diff = np.abs(source - target)
+        with np.errstate(invalid='ignore'):
+            exceeds = diff > tolerance
+        return (source_na ^ target_na) | (~(source_na | target_na) & exceeds), diff
+
+
+def _run_starts(keys: np.ndarray) -> np.ndarray:
+    """Start position of each run of equal values in a sorted array."""
+    if not len(keys):
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+
+
+def _first_rows(codes: np.ndarray, count: int) -> np.ndarray:
+    """First row position of each of count factorized codes."""
+    first = np.empty(count, dtype=np.intp)
+    # Assign in reverse so the earliest row of each code is written last
+    first[codes[::-1]] = np.arange(len(codes) - 1, -1, -1)
+    return first
+
+
+def _merge_sorted_keys(source, target):
+    """
+    Match two sorted key arrays (vectorized numpy, any sortable dtype).
+
+    Returns (source rows, target rows) of the first row of each matched key,
+    row masks of matched source and target rows, and the unique key counts.
+    """
+    source_starts = _run_starts(source)
+    target_starts = _run_starts(target)
+    source_uniques = source[source_starts]
+    target_uniques = target[target_starts]
+
+    positions = np.searchsorted(target_uniques, source_uniques)
+    found = positions < len(target_uniques)
+    found[found] = target_uniques[positions[found]] == source_uniques[found]
+    target_found = np.zeros(len(target_starts), dtype=bool)
+    target_found[positions[found]] = True
+
+    source_matched = np.repeat(found, np.diff(np.append(source_starts, len(source))))
+    target_matched = np.repeat(target_found, np.diff(np.append(target_starts, len(target))))
+    return (source_starts[found], target_starts[positions[found]],
+            source_matched, target_matched, len(source_starts), len(target_starts))
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _merge_sorted_numeric_keys(source, target):
+        """Two-pointer merge of sorted numeric keys (single compiled pass)."""
+        n, m = source.shape[0], target.shape[0]
+        source_rows = np.empty(min(n, m), dtype=np.int64)
+        target_rows = np.empty(min(n, m), dtype=np.int64)
+        source_matched = np.zeros(n, dtype=np.bool_)
+        target_matched = np.zeros(m, dtype=np.bool_)
+        matched = source_runs = target_runs = 0
+        i = j = 0
+        while i < n or j < m:
+            # End of the current run of equal keys on each side
+            i_end = i + 1
+            while i_end < n and source[i_end] == source[i]:
+                i_end += 1
+            j_end = j + 1
+            while j_end < m and target[j_end] == target[j]:
+                j_end += 1
+
+            if j >= m or (i < n and source[i] < target[j]):
+                source_runs += 1
+                i = i_end
+            elif i >= n or target[j] < source[i]:
+                target_runs += 1
+                j = j_end
+            else:
+                source_matched[i:i_end] = True
+                target_matched[j:j_end] = True
+                source_rows[matched] = i
+                target_rows[matched] = j
+                matched += 1
+                source_runs += 1
+                target_runs += 1
+                i = i_end
+                j = j_end
+        return (source_rows[:matched], target_rows[:matched],
+                source_matched, target_matched, source_runs, target_runs)
+else:
+    _merge_sorted_numeric_keys = _merge_sorted_keys
+
+
+def _compare_values(source: pd.Series, target: pd.Series,
+                    tolerance: float) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Compare two aligned columns.
+    Returns (mismatch mask, absolute differences or None for non-numeric columns)
+    """
+    # Numeric comparison with tolerance (bools compare by equality)
+    if (pd.api.types.is_numeric_dtype(source) and pd.api.types.is_numeric_dtype(target)
+            and not pd.api.types.is_bool_dtype(source) and not pd.api.types.is_bool_dtype(target)):
+        return _numeric_mismatch(source.to_numpy(dtype='float64', na_value=np.nan),
+                                 target.to_numpy(dtype='float64', na_value=np.nan),
+                                 float(tolerance))
+
+    source_na = source.isna().to_numpy()
+    target_na = target.isna().to_numpy()
+    one_null = source_na ^ target_na
+    both_present = ~(source_na | target_na)
+
+    # Equality comparison
+    differs = source.ne(target).fillna(True).to_numpy(dtype=bool)
+    return one_null | (both_present & differs), None
+
+
+def _compare_partition(source: pd.DataFrame, target: pd.DataFrame,
+                       tolerance: Dict[str, float]) -> List[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """Compare every column of one row partition (runs in a worker process)."""
+    return [_compare_values(source[col], target[col], tolerance.get(col, 0)) for col in source.columns]
+
+
+def _write_excel_sheet(workbook, sheet_name: str, df: pd.DataFrame, header_format,
+                       chunk_size: int = 10_000):
+    """
+    Write df to new worksheets in row order, for constant_memory workbooks.
+
+    Rows are converted chunk by chunk, so only chunk_size rows are boxed
+    into Python objects at a time. Nulls are written as blank cells. Frames
+    longer than a worksheet (EXCEL_MAX_ROWS including the header) continue
+    on 'sheet_name (2)', 'sheet_name (3)', ... instead of being cut off.
+    """
+    rows_per_sheet = EXCEL_MAX_ROWS - 1
+    sheet_count = max(1, -(-len(df) // rows_per_sheet))
+    if sheet_count > 1:
+        logger.warning(f"{sheet_name}: {len(df)} rows exceed one Excel sheet; "
+                       f"splitting across {sheet_count} sheets")
+
+    for sheet in range(sheet_count):
+        name = sheet_name if sheet == 0 else f"{sheet_name} ({sheet + 1})"
+        worksheet = workbook.add_worksheet(name)
+        worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+
+        sheet_rows = df.iloc[sheet * rows_per_sheet:(sheet + 1) * rows_per_sheet]
+        for start in range(0, len(sheet_rows), chunk_size):
+            part = sheet_rows.iloc[start:start + chunk_size]
+            columns = [values.astype(object).where(values.notna(), None).tolist()
+                       for _, values in part.items()]
+            for offset, row in enumerate(zip(*columns)):
+                # xlsxwriter signals dropped cells with -1 instead of raising
+                if worksheet.write_row(start + offset + 1, 0, row) == -1:
+                    raise ValueError(f"Excel rejected row {start + offset + 1} of sheet '{name}'")
+
+
+@dataclass
+class _KeyMatch:
+    """Positional result of matching source keys against target keys."""
+    source_rows: np.ndarray  # First source row of each matched key
+    target_rows: np.ndarray  # First target row of each matched key
+    source_matched: np.ndarray  # Row mask: source row has a matching key
+    target_matched: np.ndarray  # Row mask: target row has a matching key
+    source_key_count: int
+    target_key_count: int
+
 
 @dataclass
 class ReconciliationConfig:
@@ -33,6 +237,9 @@ class ReconciliationConfig:
     ignore_case: bool = True
     trim_whitespace: bool = True
     date_format: Optional[str] = None
+    hash_keys: bool = True  # Match on 64-bit row hashes of the key columns instead of joined strings
+    keys_sorted: bool = False  # Inputs are sorted by the key column: match with a linear merge, no hashing
+    n_workers: int = 1  # Processes for the column comparison on large inputs (1 = in-process)
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -63,13 +270,62 @@ class ReconciliationResult:
 
 
 class ReconciliationEngine:
-    """Core engine for data reconciliation."""
+    """
+    Core engine for data reconciliation.
+
+    Accepts NumPy- or Arrow-backed frames; load large CSVs with
+    DataLoader.load_csv to parse them with PyArrow straight into Arrow
+    columns.
+    """
 
     def __init__(self, config: ReconciliationConfig):
         self.config = config
         self.tolerance = config.tolerance or {}
+        # Normalized frame and composite key per input frame, for reconciling
+        # one dataset against several others (see clear_cache)
+        self._norm_cache: Dict[int, Tuple[weakref.ref, tuple, Dict[str, Any]]] = {}
         logger.info(f"Initialized ReconciliationEngine with tolerance: {self.tolerance}")
 
+    def clear_cache(self):
+        """Drop cached normalized frames and keys (e.g. after modifying an input in place)."""
+        self._norm_cache.clear()
+
+    def _cache_entry(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Cache slot for df, keyed by object identity plus shape, columns and
+        config. Edits that keep all of those (in-place value changes) are
+        not detected; call clear_cache() after making them.
+        """
+        df_id = id(df)
+        signature = (df.shape, tuple(df.columns), repr(self.config))
+        cached = self._norm_cache.get(df_id)
+        if cached is not None and cached[0]() is df and cached[1] == signature:
+            return cached[2]
+
+        entry: Dict[str, Any] = {}
+        # The weakref drops the entry when df is garbage collected, so a new
+        # frame that reuses the id never sees stale data
+        ref = weakref.ref(df, lambda _, cache=self._norm_cache: cache.pop(df_id, None))
+        self._norm_cache[df_id] = (ref, signature, entry)
+        return entry
+
+    def _get_normalized(self, df: pd.DataFrame) -> pd.DataFrame:
+        """normalize_data over the key and compare columns, once per input frame."""
+        entry = self._cache_entry(df)
+        if 'normalized' not in entry:
+            # Only key and compare columns are ever read from the normalized
+            # frame; mismatch values come from df itself by row position
+            entry['normalized'] = self.normalize_data(
+                df, columns=self.config.key_columns + self.config.compare_columns)
+        return entry['normalized']
+
+    def _get_composite_key(self, df: pd.DataFrame) -> np.ndarray:
+        """Composite key of the normalized df, computed once per input frame."""
+        entry = self._cache_entry(df)
+        if 'key' not in entry:
+            entry['key'] = self.create_composite_key(self._get_normalized(df)).to_numpy()
+        return entry['key']
+
     def validate_dataframes(self, source_df: pd.DataFrame, target_df: pd.DataFrame):
         """Validate dataframes before reconciliation."""
         # Check for empty dataframes
@@ -98,60 +354,184 @@ class ReconciliationEngine:
 
         logger.info(f"Dataframes validated - Source: {len(source_df)} rows, Target: {len(target_df)} rows")
         
-    def normalize_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize data based on configuration."""
-        df = df.copy()
-        
-        # Trim whitespace
-        if self.config.trim_whitespace:
-            for col in df.select_dtypes(include=['object']).columns:
-                df[col] = df[col].str.strip() if df[col].dtype == 'object' else df[col]
-        
-        # Handle case insensitivity
-        if self.config.ignore_case:
-            for col in df.select_dtypes(include=['object']).columns:
-                df[col] = df[col].str.lower() if df[col].dtype == 'object' else df[col]
-        
-        # Parse dates if format specified
-        if self.config.date_format:
-            date_cols = df.select_dtypes(include=['object']).columns
-            for col in date_cols:
+    def normalize_data(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Normalize data based on configuration.
+
+        Returns a shallow copy: only the text columns are rebuilt, every other
+        column shares its data with `df`. Key and compare columns holding
+        plain Python strings are moved to Arrow-backed strings first, so the
+        string ops, hashing and equality run in Arrow kernels.
+
+        Args:
+            df: Dataframe to normalize
+            columns: Only normalize these columns (default: all text columns)
+        """
+        df = df.copy(deep=False)
+        text_cols = df.select_dtypes(include=['object', 'string']).columns
+        if columns is not None:
+            wanted = set(columns)
+            text_cols = [col for col in text_cols if col in wanted]
+        arrow_cols = set(self.config.key_columns) | set(self.config.compare_columns) if PYARROW_AVAILABLE else set()
+
+        for col in text_cols:
+            values = df[col]
+            if (col in arrow_cols and values.dtype == object
+                    and pd.api.types.infer_dtype(values, skipna=True) == 'string'):
+                values = values.astype('string[pyarrow]')
+            # Trim whitespace
+            if self.config.trim_whitespace:
+                values = values.str.strip()
+            # Handle case insensitivity
+            if self.config.ignore_case:
+                values = values.str.lower()
+            # Parse dates if format specified
+            if self.config.date_format:
                 try:
-                    df[col] = pd.to_datetime(df[col], format=self.config.date_format, errors='coerce')
+                    values = pd.to_datetime(values, format=self.config.date_format, errors='coerce')
                 except:
                     pass
-        
+            df[col] = values
+
         return df
     
     def create_composite_key(self, df: pd.DataFrame) -> pd.Series:
-        """Create composite key from key columns."""
-        key_parts = [df[col].astype(str) for col in self.config.key_columns]
-        return pd.Series(['|'.join(parts) for parts in zip(*key_parts)], index=df.index)
-    
-    def compare_values(self, val1: Any, val2: Any, column: str) -> Tuple[bool, Optional[float]]:
         """
-        Compare two values with tolerance handling.
-        Returns (is_match, difference)
+        Create composite key from key columns.
+
+        With config.hash_keys the key is a uint64 hash of the stringified key
+        values, computed in one vectorized pass; keys still match across
+        sources whose key dtypes differ (e.g. 1 and '1'). String columns are
+        hashed as they are, other columns through astype(str); nulls hash alike
+        whatever the dtype. Otherwise it is the values joined with '|'.
         """
-        # Handle null values
-        if pd.isna(val1) and pd.isna(val2):
-            return True, None
-        if pd.isna(val1) or pd.isna(val2):
-            return False, None
-        
-        # Numeric comparison with tolerance
-        if isinstance(val1, (int, float)) and isinstance(val2, (int, float)):
-            diff = abs(val1 - val2)
-            tolerance = self.tolerance.get(column, 0)
-            return diff <= tolerance, diff
-        
-        # String comparison
-        return val1 == val2, None
+        if self.config.hash_keys:
+            key_frame = pd.DataFrame({
+                i: df[col] if pd.api.types.is_string_dtype(df[col]) and df[col].dtype != object
+                else df[col].astype(str).where(df[col].notna())
+                for i, col in enumerate(self.config.key_columns)
+            }, index=df.index)
+            return pd.util.hash_pandas_object(key_frame, index=False)
+        return pd.Series(self._key_strings(df), index=df.index)
+
+    def _key_strings(self, df: pd.DataFrame) -> List[str]:
+        """Readable composite keys: key column values joined with '|'."""
+        # Joining plain lists is faster than iterating Series (or itertuples)
+        key_parts = [df[col].astype(str).tolist() for col in self.config.key_columns]
+        if len(key_parts) == 1:
+            return key_parts[0]
+        return ['|'.join(parts) for parts in zip(*key_parts)]
     
+    def _compare_columns(self, source: pd.Series, target: pd.Series,
+                         column: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Compare two aligned columns: both null matches, one null mismatches,
+        numbers within the column's tolerance match, anything else must be equal.
+        Returns (mismatch mask, absolute differences or None for non-numeric columns)
+        """
+        return _compare_values(source, target, self.tolerance.get(column, 0))
+
+    def _compare_parallel(self, source: pd.DataFrame,
+                          target: pd.DataFrame) -> Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """
+        _compare_columns for every column, over contiguous row partitions in
+        config.n_workers processes. Partition results are concatenated in
+        order, so the output matches the single-process comparison.
+        """
+        bounds = np.linspace(0, len(source), self.config.n_workers + 1, dtype=int)
+        # spawn, not fork: forking after numba/Arrow have started their thread
+        # pools can deadlock the workers
+        with ProcessPoolExecutor(max_workers=self.config.n_workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            parts = list(executor.map(
+                _compare_partition,
+                [source.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])],
+                [target.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])],
+                repeat(self.tolerance)
+            ))
+
+        comparisons = {}
+        for i, col in enumerate(source.columns):
+            masks, diffs = zip(*(part[i] for part in parts))
+            comparisons[col] = (np.concatenate(masks),
+                                np.concatenate(diffs) if diffs[0] is not None else None)
+        return comparisons
+
+    def _match_hashed_keys(self, source_key: np.ndarray, target_key: np.ndarray) -> _KeyMatch:
+        """Match rows on composite keys (hash-based, any key order)."""
+        # Factorize each side once (codes in order of first appearance), then
+        # look the source uniques up in the target uniques; every row mask and
+        # first-row position follows from the codes, with no set operations
+        source_codes, source_uniques = pd.factorize(source_key)
+        target_codes, target_uniques = pd.factorize(target_key)
+        positions = pd.Index(target_uniques).get_indexer(source_uniques)
+        found = positions >= 0
+        target_found = np.zeros(len(target_uniques), dtype=bool)
+        target_found[positions[found]] = True
+
+        return _KeyMatch(
+            source_rows=_first_rows(source_codes, len(source_uniques))[found],
+            target_rows=_first_rows(target_codes, len(target_uniques))[positions[found]],
+            source_matched=found[source_codes],
+            target_matched=target_found[target_codes],
+            source_key_count=len(source_uniques),
+            target_key_count=len(target_uniques)
+        )
+
+    def _match_sorted_keys(self, source_norm: pd.DataFrame, target_norm: pd.DataFrame) -> Optional[_KeyMatch]:
+        """
+        Match rows with a linear merge over keys that are already sorted.
+
+        Applies to a single null-free key column sorted ascending after
+        normalization, holding the same kind of values on both sides:
+        integers, floats of one width, or text. Those are exactly the cases
+        where equal values have equal string forms, so the result matches the
+        hashed path (which compares stringified keys: 1 and 1.0 differ there).
+        Returns None otherwise so the caller falls back to hashed keys.
+        """
+        if len(self.config.key_columns) != 1:
+            logger.info("keys_sorted needs a single key column; matching on hashed keys")
+            return None
+        key_col = self.config.key_columns[0]
+        source_key, target_key = source_norm[key_col], target_norm[key_col]
+        same_kind = source_key.dtype.kind == target_key.dtype.kind
+
+        if (source_key.isna().any() or target_key.isna().any()
+                or not (source_key.is_monotonic_increasing and target_key.is_monotonic_increasing)):
+            logger.warning(f"keys_sorted is set but '{key_col}' is not sorted or has nulls; matching on hashed keys")
+            return None
+
+        merge, source_values, target_values = None, None, None
+        if same_kind and pd.api.types.is_integer_dtype(source_key) and pd.api.types.is_integer_dtype(target_key):
+            dtype = 'uint64' if source_key.dtype.kind == 'u' else 'int64'
+            merge = _merge_sorted_numeric_keys
+            source_values, target_values = source_key.to_numpy(dtype=dtype), target_key.to_numpy(dtype=dtype)
+        elif (same_kind and pd.api.types.is_float_dtype(source_key) and pd.api.types.is_float_dtype(target_key)
+                and source_key.dtype.itemsize == target_key.dtype.itemsize):
+            source_values, target_values = source_key.to_numpy(dtype='float64'), target_key.to_numpy(dtype='float64')
+            # -0.0 equals 0.0 numerically but not as text
+            if not any(np.signbit(values[values == 0]).any() for values in (source_values, target_values)):
+                merge = _merge_sorted_numeric_keys
+        elif (pd.api.types.infer_dtype(source_key, skipna=True) == 'string'
+                and pd.api.types.infer_dtype(target_key, skipna=True) == 'string'):
+            merge = _merge_sorted_keys
+            source_values, target_values = source_key.to_numpy(dtype=object), target_key.to_numpy(dtype=object)
+
+        if merge is None:
+            logger.warning(f"keys_sorted is set but '{key_col}' does not hold the same kind of values "
+                           f"in source and target; matching on hashed keys")
+            return None
+
+        return _KeyMatch(*merge(source_values, target_values))
+
     def reconcile(self, source_df: pd.DataFrame, target_df: pd.DataFrame, show_progress: bool = True) -> ReconciliationResult:
         """
         Perform reconciliation between source and target datasets.
 
+        Normalized data and composite keys are cached per input frame, so
+        reconciling one frame against several others prepares it once. Call
+        clear_cache() after modifying an input frame in place.
+
         Args:
             source_df: Source dataframe
             target_df: Target dataframe
@@ -169,83 +549,108 @@ class ReconciliationEngine:
 
             # Normalize data
             logger.info("Normalizing data...")
-            source_norm = self.normalize_data(source_df)
-            target_norm = self.normalize_data(target_df)
+            source_norm = self._get_normalized(source_df)
+            target_norm = self._get_normalized(target_df)
 
-            # Create composite keys
-            logger.info("Creating composite keys...")
-            source_norm['_key'] = self.create_composite_key(source_norm)
-            target_norm['_key'] = self.create_composite_key(target_norm)
+            # Match keys: a linear merge when inputs arrive sorted by key,
+            # otherwise hashed composite keys
+            logger.info("Matching keys...")
+            match = self._match_sorted_keys(source_norm, target_norm) if self.config.keys_sorted else None
+            if match is None:
+                match = self._match_hashed_keys(self._get_composite_key(source_df),
+                                                self._get_composite_key(target_df))
 
-            # Check for duplicate keys
-            source_dup_keys = source_norm['_key'].duplicated().sum()
-            target_dup_keys = target_norm['_key'].duplicated().sum()
+            source_dup_keys = len(source_norm) - match.source_key_count
+            target_dup_keys = len(target_norm) - match.target_key_count
             if source_dup_keys > 0:
                 logger.warning(f"Found {source_dup_keys} duplicate keys in source data")
             if target_dup_keys > 0:
                 logger.warning(f"Found {target_dup_keys} duplicate keys in target data")
 
-            # Find matching keys
-            logger.info("Matching keys...")
-            source_keys = set(source_norm['_key'])
-            target_keys = set(target_norm['_key'])
-
-            matched_keys = source_keys & target_keys
-            unmatched_source_keys = source_keys - target_keys
-            unmatched_target_keys = target_keys - source_keys
-
-            logger.info(f"Matched: {len(matched_keys)}, Unmatched Source: {len(unmatched_source_keys)}, Unmatched Target: {len(unmatched_target_keys)}")
+            matched_count = len(match.source_rows)
+            source_key_count = match.source_key_count
+            unmatched_source_count = source_key_count - matched_count
+            unmatched_target_count = match.target_key_count - matched_count
+            logger.info(f"Matched: {matched_count}, Unmatched Source: {unmatched_source_count}, Unmatched Target: {unmatched_target_count}")
 
             # Extract unmatched records
-            unmatched_source = source_df[source_norm['_key'].isin(unmatched_source_keys)].copy()
-            unmatched_target = target_df[target_norm['_key'].isin(unmatched_target_keys)].copy()
+            # take returns a new frame already (and, unlike a boolean
+            # selection, one pandas does not flag as a copy of source_df)
+            unmatched_source = source_df.take(np.flatnonzero(~match.source_matched))
+            unmatched_target = target_df.take(np.flatnonzero(~match.target_matched))
 
-            # Compare matched records
+            # Compare matched records: gather each matched key's first source and
+            # target row by position, then compare whole columns at once
             logger.info("Comparing matched records...")
-            mismatches = []
+            compare_cols = list(dict.fromkeys(self.config.compare_columns))
+            source_rows, target_rows = match.source_rows, match.target_rows
+            del match  # Row masks are consumed; release them before gathering matched rows
+            matched_source = source_norm[compare_cols].take(source_rows).reset_index(drop=True)
+            matched_target = target_norm[compare_cols].take(target_rows).reset_index(drop=True)
 
             # Use tqdm for progress tracking if enabled
-            key_iterator = tqdm(matched_keys, desc="Comparing records", disable=not show_progress) if show_progress else matched_keys
-
-            for key in key_iterator:
-                source_row = source_norm[source_norm['_key'] == key].iloc[0]
-                target_row = target_norm[target_norm['_key'] == key].iloc[0]
-
-                for col in self.config.compare_columns:
-                    is_match, diff = self.compare_values(source_row[col], target_row[col], col)
-
-                    if not is_match:
-                        # Get original values (before normalization)
-                        orig_source = source_df[source_norm['_key'] == key].iloc[0]
-                        orig_target = target_df[target_norm['_key'] == key].iloc[0]
-
-                        mismatch = {
-                            'key': key,
-                            'column': col,
-                            f'{self.config.source_name}_value': orig_source[col],
-                            f'{self.config.target_name}_value': orig_target[col],
-                            'difference': diff
-                        }
-                        # Add key column values for context
-                        for key_col in self.config.key_columns:
-                            mismatch[key_col] = orig_source[key_col]
-
-                        mismatches.append(mismatch)
-
-            mismatches_df = pd.DataFrame(mismatches) if mismatches else pd.DataFrame()
-            logger.info(f"Found {len(mismatches)} mismatches")
+            column_iterator = tqdm(compare_cols, desc="Comparing columns", mininterval=0.5) if show_progress else compare_cols
+
+            # Large comparisons can run in worker processes over row partitions
+            comparisons = None
+            if self.config.n_workers > 1 and len(matched_source) >= PARALLEL_COMPARE_MIN_ROWS:
+                logger.info(f"Comparing in {self.config.n_workers} worker processes...")
+                comparisons = self._compare_parallel(matched_source, matched_target)
+
+            # Collect mismatches column by column as arrays, then build the frame once
+            mismatch_cols, mismatch_src_rows = [], []
+            source_values, target_values, differences = [], [], []
+            for col in column_iterator:
+                if comparisons is not None:
+                    mask, diff = comparisons.pop(col)
+                else:
+                    mask, diff = self._compare_columns(matched_source[col], matched_target[col], col)
+                count = int(np.count_nonzero(mask))
+                if not count:
+                    continue
+
+                # Report original values (before normalization)
+                src_rows, tgt_rows = source_rows[mask], target_rows[mask]
+                mismatch_cols.append(np.full(count, col, dtype=object))
+                mismatch_src_rows.append(src_rows)
+                source_values.append(source_df[col].iloc[src_rows].to_numpy(dtype=object))
+                target_values.append(target_df[col].iloc[tgt_rows].to_numpy(dtype=object))
+                differences.append(diff[mask] if diff is not None else np.full(count, np.nan))
+
+            # The aligned copies are the largest intermediates; drop them
+            # before the mismatch frame is assembled
+            del matched_source, matched_target, comparisons
+
+            if mismatch_cols:
+                src_rows = np.concatenate(mismatch_src_rows)
+                mismatch_data = {
+                    'key': self._key_strings(source_norm.iloc[src_rows]),
+                    'column': np.concatenate(mismatch_cols),
+                    f'{self.config.source_name}_value': np.concatenate(source_values),
+                    f'{self.config.target_name}_value': np.concatenate(target_values),
+                    'difference': np.concatenate(differences)
+                }
+                # Add key column values for context
+                for key_col in self.config.key_columns:
+                    mismatch_data[key_col] = source_df[key_col].iloc[src_rows].to_numpy(dtype=object)
+                del mismatch_cols, mismatch_src_rows, source_values, target_values, differences
+                mismatches_df = pd.DataFrame(mismatch_data)
+                del mismatch_data
+            else:
+                mismatches_df = pd.DataFrame()
+            logger.info(f"Found {len(mismatches_df)} mismatches")
         
             # Create summary
             processing_time = (datetime.now() - start_time).total_seconds()
             summary = {
                 'total_source_records': len(source_df),
                 'total_target_records': len(target_df),
-                'matched_records': len(matched_keys),
-                'unmatched_source_records': len(unmatched_source_keys),
-                'unmatched_target_records': len(unmatched_target_keys),
-                'mismatched_values': len(mismatches),
-                'match_rate': len(matched_keys) / max(len(source_keys), 1) * 100,
-                'accuracy_rate': (len(matched_keys) - len(mismatches_df)) / max(len(matched_keys), 1) * 100 if len(matched_keys) > 0 else 0,
+                'matched_records': matched_count,
+                'unmatched_source_records': unmatched_source_count,
+                'unmatched_target_records': unmatched_target_count,
+                'mismatched_values': len(mismatches_df),
+                'match_rate': matched_count / max(source_key_count, 1) * 100,
+                'accuracy_rate': (matched_count - len(mismatches_df)) / max(matched_count, 1) * 100 if matched_count > 0 else 0,
                 'processing_time_seconds': processing_time,
                 'source_duplicate_keys': int(source_dup_keys),
                 'target_duplicate_keys': int(target_dup_keys)
@@ -255,7 +660,7 @@ class ReconciliationEngine:
             logger.info(f"Match rate: {summary['match_rate']:.2f}%")
 
             return ReconciliationResult(
-                matched_count=len(matched_keys),
+                matched_count=matched_count,
                 unmatched_source=unmatched_source,
                 unmatched_target=unmatched_target,
                 mismatches=mismatches_df,
@@ -274,7 +679,14 @@ class ReconciliationEngine:
         Args:
             result: ReconciliationResult to export
             output_dir: Output directory path
-            format: Export format ('csv', 'excel', 'both') - default 'csv'
+            format: Export format ('csv', 'excel', 'both', 'parquet') - default 'csv'
+
+        Parquet output keeps column dtypes, including Arrow-backed strings,
+        which CSV turns back into untyped text.
+
+        The Excel report is written in xlsxwriter's constant_memory mode:
+        memory stays flat however large the sheets, but cells cannot be
+        revisited, so apply any extra formatting after opening the file.
         """
         try:
             import os
@@ -302,28 +714,59 @@ class ReconciliationEngine:
                     logger.info(f"Exported {len(result.mismatches)} mismatches")
 
             if format in ['excel', 'both']:
-                # Export to Excel with multiple sheets
+                # Export to Excel with multiple sheets. constant_memory flushes
+                # each row to disk as it is written, so sheets are written row
+                # by row here (pandas' to_excel writes column by column, which
+                # that mode would silently truncate)
+                import xlsxwriter
                 excel_file = output_path / "reconciliation_report.xlsx"
-                with pd.ExcelWriter(excel_file, engine='xlsxwriter') as writer:
+                with xlsxwriter.Workbook(str(excel_file), {
+                    'constant_memory': True,
+                    'strings_to_urls': False,
+                    'remove_timezone': True,
+                    'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+                }) as workbook:
+                    header_format = workbook.add_format({'bold': True, 'border': 1})
+
                     # Summary sheet
-                    summary_df = pd.DataFrame([result.summary]).T
-                    summary_df.columns = ['Value']
-                    summary_df.to_excel(writer, sheet_name='Summary')
+                    summary_df = pd.DataFrame({'': list(result.summary), 'Value': list(result.summary.values())})
+                    _write_excel_sheet(workbook, 'Summary', summary_df, header_format)
 
                     # Unmatched source
                     if not result.unmatched_source.empty:
-                        result.unmatched_source.to_excel(writer, sheet_name='Unmatched Source', index=False)
+                        _write_excel_sheet(workbook, 'Unmatched Source', result.unmatched_source, header_format)
 
                     # Unmatched target
                     if not result.unmatched_target.empty:
-                        result.unmatched_target.to_excel(writer, sheet_name='Unmatched Target', index=False)
+                        _write_excel_sheet(workbook, 'Unmatched Target', result.unmatched_target, header_format)
 
                     # Mismatches
                     if not result.mismatches.empty:
-                        result.mismatches.to_excel(writer, sheet_name='Mismatches', index=False)
+                        _write_excel_sheet(workbook, 'Mismatches', result.mismatches, header_format)
 
                 logger.info(f"Exported Excel report to {excel_file}")
 
+            if format == 'parquet':
+                # Columnar and ZSTD-compressed; unlike CSV, keeps column dtypes
+                # (including Arrow-backed ones) on the round trip
+                parquet_options = {'index': False, 'compression': 'zstd'}
+                if PYARROW_AVAILABLE:
+                    parquet_options['engine'] = 'pyarrow'
+                if not result.unmatched_source.empty:
+                    result.unmatched_source.to_parquet(
+                        output_path / f"unmatched_{self.config.source_name}.parquet", **parquet_options)
+
+                if not result.unmatched_target.empty:
+                    result.unmatched_target.to_parquet(
+                        output_path / f"unmatched_{self.config.target_name}.parquet", **parquet_options)
+
+                if not result.mismatches.empty:
+                    # Value columns mix types across compare columns, store them as text
+                    value_cols = [f'{self.config.source_name}_value', f'{self.config.target_name}_value']
+                    mismatches = result.mismatches.astype({col: 'string' for col in value_cols})
+                    mismatches.to_parquet(output_path / "mismatches.parquet", **parquet_options)
+                    logger.info(f"Exported {len(result.mismatches)} mismatches")
+
             # Export summary JSON
             summary_file = output_path / "summary.json"
             with open(summary_file, 'w') as f:
@@ -350,9 +793,11 @@ if __name__ == "__main__":
         trim_whitespace=True
     )
     
-    # Load data
-    source = pd.read_csv("source_data.csv")
-    target = pd.read_csv("target_data.csv")
+    # Load data (multi-threaded PyArrow parser with Arrow-backed columns
+    # when pyarrow is installed; the engine works on those columns directly)
+    from data_loader import DataLoader
+    source = DataLoader.load_csv("source_data.csv")
+    target = DataLoader.load_csv("target_data.csv")
     
     # Reconcile
     engine = ReconciliationEngine(config)
@@ -4,11 +4,21 @@ Visualization module for reconciliation results.
 Creates charts and graphs to help understand reconciliation outcomes.
 """
 
+import os
+import sys
 import pandas as pd
+import matplotlib
+
+# Render without a GUI on headless Linux (scheduled and CI runs), unless a
+# backend is chosen explicitly through MPLBACKEND
+if sys.platform.startswith('linux') and not os.environ.get('DISPLAY') and 'MPLBACKEND' not in os.environ:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Optional, List
+from typing import Optional, List, Union
 from pathlib import Path
+import json
 import logging
 
 try:
@@ -23,6 +33,12 @@ from reconcile_engine import ReconciliationResult
 
 logger = logging.getLogger(__name__)
 
+# Mismatch columns the charts use; other columns are not read from Parquet
+MISMATCH_PLOT_COLUMNS = ['column', 'difference']
+
+# Resolution of saved static charts; pass dpi=300 for print quality
+DEFAULT_DPI = 150
+
 # Set style
 sns.set_theme(style="whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
@@ -31,30 +47,91 @@ plt.rcParams['figure.figsize'] = (12, 6)
 class ReconciliationVisualizer:
     """Create visualizations for reconciliation results."""
 
-    def __init__(self, result: ReconciliationResult):
+    def __init__(self, result: Union[ReconciliationResult, str, Path]):
         """
         Initialize visualizer with reconciliation result.
 
         Args:
-            result: ReconciliationResult to visualize
+            result: ReconciliationResult to visualize, or the path of a
+                mismatches.parquet written by export_results(format='parquet').
+                With a path only the plotted columns are read, on first use,
+                and the summary comes from summary.json next to it.
         """
-        self.result = result
-        self.summary = result.summary
+        if isinstance(result, (str, Path)):
+            self.result = None
+            self._mismatches_path = Path(result)
+            self._mismatches = None
+            with open(self._mismatches_path.parent / "summary.json") as f:
+                self.summary = json.load(f)
+        else:
+            self.result = result
+            self._mismatches_path = None
+            self._mismatches = result.mismatches
+            self.summary = result.summary
+        # Per-column aggregates, computed once on first use
+        self._column_counts = None
+        self._differences_by_column = None
+
+    @property
+    def mismatches(self) -> pd.DataFrame:
+        """Mismatch records, read from Parquet on first access when given a path."""
+        if self._mismatches is None:
+            if self._mismatches_path.exists():
+                self._mismatches = pd.read_parquet(self._mismatches_path, columns=MISMATCH_PLOT_COLUMNS)
+            else:
+                self._mismatches = pd.DataFrame(columns=MISMATCH_PLOT_COLUMNS)
+        return self._mismatches
+
+    @property
+    def column_counts(self) -> pd.Series:
+        """Number of mismatches per column, most frequent first."""
+        if self._column_counts is None:
+            self._column_counts = self.mismatches['column'].value_counts()
+        return self._column_counts
+
+    def _column_differences(self, column: str) -> Optional[pd.Series]:
+        """Differences recorded for one column's mismatches (None if it has none)."""
+        if self._differences_by_column is None:
+            # One grouping pass serves every per-column chart
+            self._differences_by_column = dict(tuple(self.mismatches.groupby('column')['difference']))
+        return self._differences_by_column.get(column)
+
+    @staticmethod
+    def _should_display(output_file: Optional[str], display: Optional[bool]) -> bool:
+        """Show charts when asked to, or by default when nothing is saved."""
+        return display if display is not None else not output_file
+
+    def _finish_figure(self, fig, output_file: Optional[str], display: Optional[bool],
+                       dpi: int, description: str):
+        """Save a matplotlib figure, then show it or release it."""
+        if output_file:
+            fig.savefig(output_file, dpi=dpi, bbox_inches='tight')
+            logger.info(f"{description} saved to {output_file}")
 
-    def create_summary_chart(self, output_file: Optional[str] = None, interactive: bool = False):
+        if self._should_display(output_file, display):
+            plt.show()
+        else:
+            plt.close(fig)
+        return fig
+
+    def create_summary_chart(self, output_file: Optional[str] = None, interactive: bool = False,
+                             display: Optional[bool] = None, dpi: int = DEFAULT_DPI):
         """
         Create a summary chart showing match/mismatch statistics.
 
         Args:
             output_file: Path to save the chart (None = display only)
             interactive: Use plotly for interactive chart (default: False, uses matplotlib)
+            display: Show the chart window (default: only when output_file is None)
+            dpi: Resolution of the saved image (default: DEFAULT_DPI)
         """
         if interactive and PLOTLY_AVAILABLE:
-            return self._create_summary_chart_plotly(output_file)
+            return self._create_summary_chart_plotly(output_file, display)
         else:
-            return self._create_summary_chart_matplotlib(output_file)
+            return self._create_summary_chart_matplotlib(output_file, display, dpi)
 
-    def _create_summary_chart_matplotlib(self, output_file: Optional[str] = None):
+    def _create_summary_chart_matplotlib(self, output_file: Optional[str] = None,
+                                         display: Optional[bool] = None, dpi: int = DEFAULT_DPI):
         """Create summary chart using matplotlib."""
         fig, axes = plt.subplots(1, 2, figsize=(14, 6))
 
@@ -89,14 +166,10 @@ class ReconciliationVisualizer:
 
         plt.tight_layout()
 
-        if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            logger.info(f"Summary chart saved to {output_file}")
+        return self._finish_figure(fig, output_file, display, dpi, "Summary chart")
 
-        plt.show()
-        return fig
-
-    def _create_summary_chart_plotly(self, output_file: Optional[str] = None):
+    def _create_summary_chart_plotly(self, output_file: Optional[str] = None,
+                                     display: Optional[bool] = None):
         """Create summary chart using plotly (interactive)."""
         from plotly.subplots import make_subplots
 
@@ -137,22 +210,26 @@ class ReconciliationVisualizer:
             fig.write_html(output_file)
             logger.info(f"Interactive summary chart saved to {output_file}")
 
-        fig.show()
+        if self._should_display(output_file, display):
+            fig.show()
         return fig
 
-    def create_mismatch_analysis(self, output_file: Optional[str] = None):
+    def create_mismatch_analysis(self, output_file: Optional[str] = None,
+                                 display: Optional[bool] = None, dpi: int = DEFAULT_DPI):
         """
         Create detailed analysis of mismatches by column.
 
         Args:
             output_file: Path to save the chart (None = display only)
+            display: Show the chart window (default: only when output_file is None)
+            dpi: Resolution of the saved image (default: DEFAULT_DPI)
         """
-        if self.result.mismatches.empty:
+        if self.mismatches.empty:
             logger.warning("No mismatches to analyze")
             return None
 
         # Count mismatches by column
-        mismatch_counts = self.result.mismatches['column'].value_counts()
+        mismatch_counts = self.column_counts
 
         fig, ax = plt.subplots(figsize=(10, 6))
         mismatch_counts.plot(kind='barh', ax=ax, color='#e74c3c')
@@ -168,34 +245,31 @@ class ReconciliationVisualizer:
 
         plt.tight_layout()
 
-        if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            logger.info(f"Mismatch analysis saved to {output_file}")
-
-        plt.show()
-        return fig
+        return self._finish_figure(fig, output_file, display, dpi, "Mismatch analysis")
 
-    def create_numeric_difference_distribution(self, column: str, output_file: Optional[str] = None):
+    def create_numeric_difference_distribution(self, column: str, output_file: Optional[str] = None,
+                                               display: Optional[bool] = None, dpi: int = DEFAULT_DPI):
         """
         Create distribution chart for numeric differences in a specific column.
 
         Args:
             column: Column name to analyze
             output_file: Path to save the chart (None = display only)
+            display: Show the chart window (default: only when output_file is None)
+            dpi: Resolution of the saved image (default: DEFAULT_DPI)
         """
-        if self.result.mismatches.empty:
+        if self.mismatches.empty:
             logger.warning("No mismatches to analyze")
             return None
 
-        # Filter mismatches for this column
-        column_mismatches = self.result.mismatches[self.result.mismatches['column'] == column]
+        # Differences for this column
+        column_differences = self._column_differences(column)
 
-        if column_mismatches.empty:
+        if column_differences is None:
             logger.warning(f"No mismatches found for column: {column}")
             return None
 
-        # Get differences
-        differences = column_mismatches['difference'].dropna()
+        differences = column_differences.dropna()
 
         if differences.empty:
             logger.warning(f"No numeric differences found for column: {column}")
@@ -218,26 +292,24 @@ class ReconciliationVisualizer:
 
         plt.tight_layout()
 
-        if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            logger.info(f"Difference distribution chart saved to {output_file}")
-
-        plt.show()
-        return fig
+        return self._finish_figure(fig, output_file, display, dpi, "Difference distribution chart")
 
-    def create_dashboard(self, output_file: str):
+    def create_dashboard(self, output_file: str, display: bool = False, dpi: int = DEFAULT_DPI):
         """
         Create comprehensive dashboard with all visualizations.
 
         Args:
             output_file: Path to save the dashboard (HTML for interactive, PNG for static)
+            display: Also show the static dashboard window (default: False)
+            dpi: Resolution of the saved image (default: DEFAULT_DPI)
         """
         if PLOTLY_AVAILABLE and output_file.endswith('.html'):
             return self._create_dashboard_plotly(output_file)
         else:
-            return self._create_dashboard_matplotlib(output_file)
+            return self._create_dashboard_matplotlib(output_file, display, dpi)
 
-    def _create_dashboard_matplotlib(self, output_file: str):
+    def _create_dashboard_matplotlib(self, output_file: str, display: bool = False,
+                                     dpi: int = DEFAULT_DPI):
         """Create static dashboard using matplotlib."""
         fig = plt.figure(figsize=(16, 10))
         gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
@@ -288,17 +360,14 @@ class ReconciliationVisualizer:
         ax3.set_title('Match Rate %', fontweight='bold')
 
         # Mismatch analysis
-        if not self.result.mismatches.empty:
+        if not self.mismatches.empty:
             ax4 = fig.add_subplot(gs[2, :])
-            mismatch_counts = self.result.mismatches['column'].value_counts()
+            mismatch_counts = self.column_counts
             mismatch_counts.plot(kind='barh', ax=ax4, color='#e74c3c')
             ax4.set_title('Mismatches by Column', fontweight='bold')
             ax4.set_xlabel('Count')
 
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        logger.info(f"Dashboard saved to {output_file}")
-        plt.show()
-        return fig
+        return self._finish_figure(fig, output_file, display, dpi, "Dashboard")
 
     def _create_dashboard_plotly(self, output_file: str):
         """Create interactive dashboard using plotly."""
@@ -0,0 +1,6 @@
+"""Shared pytest setup: the scripts import each other flat, as the CLI does."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
@@ -0,0 +1,112 @@
+"""Tests for data_loader."""
+
+import pandas as pd
+import pytest
+
+import data_loader
+from data_loader import DataLoader, DataTransformer, PYARROW_AVAILABLE
+
+
+@pytest.fixture
+def schema_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "schema-cache"
+    monkeypatch.setattr(data_loader, '_SCHEMA_CACHE_DIR', cache_dir)
+    DataLoader._schema_cache.clear()
+    return cache_dir
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_load_csv_keeps_timestamp_text(tmp_path, schema_cache):
+    csv_file = tmp_path / "ts.csv"
+    csv_file.write_text("id,ts\n1,2024-01-01T10:00:00\n2,2024-01-02T11:30:00.5\n")
+
+    first = DataLoader.load_csv(str(csv_file))
+    DataLoader._schema_cache.clear()
+    second = DataLoader.load_csv(str(csv_file))
+
+    expected = ['2024-01-01T10:00:00', '2024-01-02T11:30:00.5']
+    assert first['ts'].tolist() == expected
+    assert second['ts'].tolist() == expected
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_csv_schema_cache_stays_out_of_data_dir(tmp_path, schema_cache):
+    data_dir = tmp_path / "multi"
+    data_dir.mkdir()
+    for i in range(3):
+        (data_dir / f"f{i}.csv").write_text(f"id,ts\n{i},2024-01-0{i + 1}T10:00:00\n")
+
+    first = DataLoader.load_multiple_files(str(data_dir / "*"), DataLoader.load_csv)
+    DataLoader._schema_cache.clear()
+    second = DataLoader.load_multiple_files(str(data_dir / "*"), DataLoader.load_csv)
+
+    assert sorted(p.name for p in data_dir.iterdir()) == ['f0.csv', 'f1.csv', 'f2.csv']
+    assert len(list(schema_cache.iterdir())) == 3
+    assert sorted(first['_source_file'].astype(str).unique()) == ['f0.csv', 'f1.csv', 'f2.csv']
+    assert first.equals(second)
+
+
+def test_map_values_empty_mapping_keeps_numeric_column():
+    df = pd.DataFrame({'x': [1, 2, 3]})
+    result = DataTransformer.map_values(df, 'x', {})
+    assert result['x'].tolist() == [1, 2, 3]
+
+
+def test_map_values_without_hits_keeps_numeric_column():
+    df = pd.DataFrame({'x': [1, 2, 3]})
+    result = DataTransformer.map_values(df, 'x', {99: 'missing'})
+    assert result['x'].tolist() == [1, 2, 3]
+
+
+def test_map_values_maps_hits_and_keeps_misses():
+    df = pd.DataFrame({'x': [0, 1, 2]})
+    result = DataTransformer.map_values(df, 'x', {0: 'No', 1: 'Yes'})
+    assert result['x'].tolist() == ['No', 'Yes', 2]
+
+
+@pytest.fixture
+def frame_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "frame-cache"
+    monkeypatch.setattr(data_loader, '_FRAME_CACHE_DIR', cache_dir)
+    return cache_dir
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_load_with_cache_same_dtypes_on_miss_and_hit(tmp_path, frame_cache):
+    excel_file = tmp_path / "data.xlsx"
+    pd.DataFrame({'id': [1, 2], 'name': ['a', 'b'], 'amount': [1.5, 2.5]}).to_excel(excel_file, index=False)
+
+    miss = DataLoader.load_with_cache(str(excel_file))
+    hit = DataLoader.load_with_cache(str(excel_file))
+
+    assert miss.dtypes.to_dict() == hit.dtypes.to_dict()
+    assert miss.equals(hit)
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_load_with_cache_removes_temp_file_when_write_fails(tmp_path, frame_cache, monkeypatch):
+    json_file = tmp_path / "data.json"
+    json_file.write_text('[{"id": 1}]')
+    mixed = pd.DataFrame({'id': [1, 'a']})
+    monkeypatch.setattr(DataLoader, 'auto_detect_and_load', staticmethod(lambda *args, **kwargs: mixed))
+
+    result = DataLoader.load_with_cache(str(json_file))
+
+    assert result is mixed
+    assert list(frame_cache.iterdir()) == []
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_load_csv_reads_date_columns_in_one_pass(tmp_path, schema_cache, monkeypatch):
+    csv_file = tmp_path / "dates.csv"
+    csv_file.write_text("id,posted,at\n1,2024-01-02,10:00:00\n2,2024-01-03,11:30:00\n")
+    reads = []
+    read_csv = data_loader.pa_csv.read_csv
+    monkeypatch.setattr(data_loader.pa_csv, 'read_csv',
+                        lambda *args, **kwargs: reads.append(args) or read_csv(*args, **kwargs))
+
+    df = DataLoader.load_csv(str(csv_file))
+
+    assert len(reads) == 1
+    assert df['posted'].tolist() == ['2024-01-02', '2024-01-03']
+    assert df['at'].tolist() == ['10:00:00', '11:30:00']
@@ -0,0 +1,26 @@
+"""Tests for data_profiler."""
+
+import pandas as pd
+import pytest
+
+from data_profiler import IntelligentDataProfiler
+
+
+@pytest.mark.parametrize('values', [
+    ['2024-01-02', '2024-01-03', '2024-02-15'],
+    ['01/02/2024', '01/03/2024', '02/15/2024'],
+    ['2024/01/02', '2024/01/03', '2024/02/15'],
+    ['02.01.2024', '03.01.2024', '15.02.2024'],
+    ['Jan 2, 2024', 'Jan 3, 2024', 'Feb 15, 2024'],
+    ['2 January 2024', '3 January 2024', '15 February 2024'],
+], ids=['iso', 'slash', 'year-first-slash', 'dotted', 'month-name', 'day-month-name'])
+def test_date_named_columns_are_date_strings(values):
+    df = pd.DataFrame({'posting_date': values * 20})
+    profile = IntelligentDataProfiler().profile_column(df, 'posting_date')
+    assert profile.inferred_type == 'date_string'
+
+
+def test_date_named_column_of_codes_is_not_a_date_string():
+    df = pd.DataFrame({'date_label': ['A', 'B', 'C'] * 20})
+    profile = IntelligentDataProfiler().profile_column(df, 'date_label')
+    assert profile.inferred_type != 'date_string'
@@ -0,0 +1,52 @@
+"""Tests for gemini_analyzer."""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('google.generativeai')
+
+from gemini_analyzer import GeminiReconciliationAnalyzer
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    monkeypatch.setenv('GEMINI_API_KEY', 'test-key')
+    analyzer = GeminiReconciliationAnalyzer(cache_dir=tmp_path / 'gemini')
+    prompts = []
+
+    def generate(prompt):
+        prompts.append(prompt)
+        return '{"patterns": []}'
+
+    monkeypatch.setattr(analyzer, '_generate', generate)
+    analyzer.prompts = prompts
+    return analyzer
+
+
+def test_semantic_cache_misses_for_a_different_context(analyzer):
+    mismatches = pd.DataFrame({
+        'column': ['amount'] * 10,
+        'source_value': [float(i) for i in range(10)],
+        'target_value': [i + 0.5 for i in range(10)],
+    })
+
+    analyzer.analyze_mismatch_patterns(mismatches, context="Bank feed vs ledger")
+    analyzer.analyze_mismatch_patterns(mismatches, context="Invoices vs payments")
+
+    assert len(analyzer.prompts) == 2
+    assert "Invoices vs payments" in analyzer.prompts[1]
+
+
+def test_anomaly_prompt_shows_exact_counts(analyzer):
+    data = pd.DataFrame({
+        'amount': [i * 1.5 for i in range(123456)],
+        'status': ['open', 'closed'] * 61728,
+    })
+
+    analyzer.detect_anomalies_batch(data, ['amount', 'status'])
+
+    amount_prompt, status_prompt = analyzer.prompts
+    assert 'count=123456 ' in amount_prompt
+    assert 'mean=9.259e+04' in amount_prompt
+    assert 'count=123456 unique=2 ' in status_prompt
+    assert 'freq=61728' in status_prompt
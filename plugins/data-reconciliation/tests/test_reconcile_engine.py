@@ -0,0 +1,67 @@
+"""Tests for reconcile_engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import reconcile_engine
+from reconcile_engine import ReconciliationConfig, ReconciliationEngine
+
+
+def _reconcile(source, target, **config):
+    engine = ReconciliationEngine(ReconciliationConfig(
+        source_name='source', target_name='target',
+        key_columns=['id'], compare_columns=['amount'], **config
+    ))
+    return engine.reconcile(source, target, show_progress=False)
+
+
+def _assert_same_result(a, b):
+    ignore = {'processing_time_seconds'}
+    assert {k: v for k, v in a.summary.items() if k not in ignore} == \
+           {k: v for k, v in b.summary.items() if k not in ignore}
+    assert a.unmatched_source.equals(b.unmatched_source)
+    assert a.unmatched_target.equals(b.unmatched_target)
+    assert a.mismatches.equals(b.mismatches)
+
+
+@pytest.mark.parametrize('make_key', [
+    lambda k: k,
+    lambda k: k * 0.5,
+    lambda k: np.array([f"t{x:06d}" for x in k], dtype=object),
+], ids=['int', 'float', 'str'])
+def test_sorted_keys_match_hashed_keys(make_key):
+    rng = np.random.default_rng(0)
+    n = 2000
+    source = pd.DataFrame({'id': make_key(np.sort(rng.integers(0, n, n))), 'amount': rng.normal(size=n).round(1)})
+    target = pd.DataFrame({'id': make_key(np.sort(rng.integers(0, n, n))), 'amount': rng.normal(size=n).round(1)})
+
+    _assert_same_result(_reconcile(source, target), _reconcile(source, target, keys_sorted=True))
+
+
+def test_sorted_float_keys_do_not_match_int_keys():
+    source = pd.DataFrame({'id': np.arange(100, dtype='float64'), 'amount': 1.0})
+    target = pd.DataFrame({'id': np.arange(100, dtype='int64'), 'amount': 1.0})
+
+    hashed = _reconcile(source, target)
+    merged = _reconcile(source, target, keys_sorted=True)
+
+    assert hashed.matched_count == 0
+    _assert_same_result(hashed, merged)
+
+
+def test_excel_export_splits_sheets_past_the_row_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(reconcile_engine, 'EXCEL_MAX_ROWS', 11)
+    source = pd.DataFrame({'id': np.arange(25), 'amount': 1.0})
+    target = pd.DataFrame({'id': np.arange(25), 'amount': 2.0})
+    engine = ReconciliationEngine(ReconciliationConfig(
+        source_name='source', target_name='target', key_columns=['id'], compare_columns=['amount']
+    ))
+    result = engine.reconcile(source, target, show_progress=False)
+
+    engine.export_results(result, str(tmp_path), format='excel')
+
+    sheets = pd.read_excel(tmp_path / 'reconciliation_report.xlsx', sheet_name=None)
+    parts = [sheets['Mismatches'], sheets['Mismatches (2)'], sheets['Mismatches (3)']]
+    assert [len(part) for part in parts] == [10, 10, 5]
+    assert pd.concat(parts)['id'].tolist() == list(range(25))